@@ -0,0 +1,87 @@
+"""
+End-to-end artifact I/O benchmark: CSV vs Parquet (and Feather) for the
+reads and writes one run_pipeline performs, at 1x, 10x and 100x the
+housing dataset size. Only I/O is timed; no model is trained.
+
+    python benchmarks/bench_artifact_io.py
+    python benchmarks/bench_artifact_io.py --scales 1 10 --formats csv parquet
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_housing import BASE_ROWS, make_housing  # noqa: E402
+from src.utils.frame_io import artifact_path, read_frame, write_frame  # noqa: E402
+
+
+def pipeline_io(df, directory: str, fmt: str) -> dict:
+    """
+    Replay the pipeline's artifact traffic and return per-step seconds.
+    """
+    timings = {}
+
+    def timed(name, fn):
+        start = time.perf_counter()
+        result = fn()
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+        return result
+
+    raw = artifact_path(directory, "housing", fmt)
+    train = artifact_path(directory, "train", fmt)
+    test = artifact_path(directory, "test", fmt)
+
+    timed("ingest_write", lambda: write_frame(df, raw))
+    timed("validate_read", lambda: read_frame(raw))
+
+    split_df = timed("split_read", lambda: read_frame(raw))
+    cut = int(len(split_df) * 0.8)
+    timed("split_write", lambda: write_frame(split_df.iloc[:cut], train))
+    timed("split_write", lambda: write_frame(split_df.iloc[cut:], test))
+
+    timed("train_read", lambda: read_frame(train))
+    timed("drift_read", lambda: (read_frame(train), read_frame(test)))
+    timed("evaluate_read", lambda: read_frame(test))
+
+    timings["total"] = sum(timings.values())
+    timings["disk_mb"] = sum(
+        os.path.getsize(p) for p in (raw, train, test)
+    ) / 2**20
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument(
+        "--formats", nargs="+", default=["csv", "parquet", "feather"]
+    )
+    parser.add_argument("--output", help="optional JSON results file")
+    args = parser.parse_args()
+
+    results = []
+    for scale in args.scales:
+        df = make_housing(BASE_ROWS * scale)
+        for fmt in args.formats:
+            with tempfile.TemporaryDirectory() as tmp:
+                timings = pipeline_io(df, tmp, fmt)
+            results.append({"scale": scale, "rows": len(df), "format": fmt, **timings})
+
+    print(f"{'scale':>5} {'rows':>9} {'format':<8} {'total s':>8} {'disk MB':>8}")
+    for r in results:
+        print(
+            f"{r['scale']:>5} {r['rows']:>9} {r['format']:<8} "
+            f"{r['total']:>8.3f} {r['disk_mb']:>8.1f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
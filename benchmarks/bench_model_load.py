@@ -0,0 +1,142 @@
+"""
+Startup benchmark: pickle.load of model.pkl vs joblib.load(mmap_mode="r")
+of the flattened model.joblib serving artifact.
+
+Each load runs in a fresh interpreter and is timed from before the first
+import of joblib/pickle, so the numbers include every module the load
+pulls in (sklearn for the pickle, only NumPy and FlatTreeEnsemble for the
+artifact) and reflect a cold worker start. "+RSS MB" is the resident
+memory added by those imports and the load (Linux, read from
+/proc/self/statm); "sklearn" tells whether the load imported sklearn.
+Usage:
+
+    python benchmarks/bench_model_load.py --model-dir artifacts/model
+    python benchmarks/bench_model_load.py --synthetic
+"""
+import argparse
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.components.flat_ensemble import FlatTreeEnsemble  # noqa: E402
+
+
+LOADERS = {
+    "pickle": (
+        "import pickle\n"
+        "with open(path, 'rb') as f:\n"
+        "    model = pickle.load(f)\n"
+    ),
+    "flat_mmap": (
+        "import joblib\n"
+        "model = joblib.load(path, mmap_mode='r')\n"
+    ),
+}
+
+# Only the stdlib modules needed for measuring are imported before the
+# clock starts; whatever the load needs is imported inside the timing
+CHILD = """
+import os, sys, time, json
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+path = sys.argv[1]
+rss_before = rss_mb()
+start = time.perf_counter()
+{loader}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "rss_mb": rss_mb() - rss_before,
+    "sklearn": "sklearn" in sys.modules
+}}))
+"""
+
+
+def build_synthetic_model(model_dir: str) -> None:
+    from sklearn.ensemble import RandomForestRegressor
+
+    rng = np.random.default_rng(42)
+    X = rng.normal(size=(16512, 13))
+    y = X @ rng.normal(size=13) + rng.normal(size=16512)
+
+    # Matches the RandomForest candidate in config/config.yaml
+    model = RandomForestRegressor(
+        n_estimators=251, max_depth=11, random_state=42, n_jobs=-1
+    ).fit(X, y)
+
+    with open(os.path.join(model_dir, "model.pkl"), "wb") as f:
+        pickle.dump(model, f)
+    FlatTreeEnsemble.from_model(model).save(
+        os.path.join(model_dir, "model.joblib")
+    )
+
+
+def run_loader(name: str, path: str) -> dict:
+    code = CHILD.format(loader=LOADERS[name])
+    out = subprocess.run(
+        [sys.executable, "-c", code, path],
+        check=True, capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model-dir", default="artifacts/model")
+    parser.add_argument("--synthetic", action="store_true")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", help="optional JSON results file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_dir = args.model_dir
+        if args.synthetic:
+            model_dir = tmp
+            build_synthetic_model(model_dir)
+
+        paths = {
+            "pickle": os.path.join(model_dir, "model.pkl"),
+            "flat_mmap": os.path.join(model_dir, "model.joblib"),
+        }
+
+        results = {}
+        for name, path in paths.items():
+            runs = [run_loader(name, path) for _ in range(args.repeats)]
+            seconds = np.array([r["seconds"] for r in runs])
+            results[name] = {
+                "file_mb": os.path.getsize(path) / 2**20,
+                "median_seconds": float(np.median(seconds)),
+                "min_seconds": float(seconds.min()),
+                "rss_mb": float(np.median([r["rss_mb"] for r in runs])),
+                "imports_sklearn": any(r["sklearn"] for r in runs),
+            }
+
+    print(
+        f"{'format':<12} {'file MB':>9} {'median s':>9} {'min s':>9} "
+        f"{'+RSS MB':>9} {'sklearn':>8}"
+    )
+    for name, r in results.items():
+        print(
+            f"{name:<12} {r['file_mb']:>9.1f} {r['median_seconds']:>9.3f} "
+            f"{r['min_seconds']:>9.3f} {r['rss_mb']:>9.1f} "
+            f"{'yes' if r['imports_sklearn'] else 'no':>8}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Inference benchmark: sklearn predict vs the flattened, vectorized
+FlatTreeEnsemble for the RandomForest and GradientBoosting candidates
+configured in config/config.yaml, at batch sizes 1, 32, 1024 and 100k.
+
+Models are trained on synthetic housing data, so no network or S3 access
+is needed. Every batch is also checked for parity with sklearn. Usage:
+
+    python benchmarks/bench_tree_inference.py
+    python benchmarks/bench_tree_inference.py --batch-sizes 1 32 --repeats 50
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor  # noqa: E402
+
+from benchmarks.synthetic_housing import BASE_ROWS, make_housing  # noqa: E402
+from src.components.feature_encoder import FeatureEncoder  # noqa: E402
+from src.components.flat_ensemble import FlatTreeEnsemble  # noqa: E402
+
+
+MODELS = {
+    "RandomForest": RandomForestRegressor,
+    "GradientBoosting": GradientBoostingRegressor,
+}
+
+TARGET = "median_house_value"
+
+
+def time_per_call(fn, X, repeats: int) -> float:
+    """
+    Median seconds per call over ``repeats`` calls (after one warm-up).
+    """
+    fn(X)
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(X)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[1, 32, 1024, 100_000]
+    )
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--config", default="config/config.yaml")
+    parser.add_argument("--output", help="optional JSON results file")
+    args = parser.parse_args()
+
+    with open(args.config, "r") as f:
+        candidates = yaml.safe_load(f)["model"]["candidates"]
+
+    train = make_housing(BASE_ROWS)
+    encoder = FeatureEncoder(target=TARGET).fit(train)
+    X_train = encoder.transform(train)
+    y_train = train[TARGET].to_numpy()
+
+    X_eval = encoder.transform(make_housing(max(args.batch_sizes), seed=7))
+
+    results = []
+    for name, model_class in MODELS.items():
+        model = model_class(**candidates[name]).fit(X_train, y_train)
+        flat = FlatTreeEnsemble.from_model(model)
+
+        for batch_size in args.batch_sizes:
+            X = X_eval[:batch_size]
+            # Large batches are slow enough that fewer repeats suffice
+            repeats = max(3, args.repeats // max(1, batch_size // 1024))
+
+            max_diff = flat.verify(model, X)
+            sklearn_s = time_per_call(model.predict, X, repeats)
+            flat_s = time_per_call(flat.predict, X, repeats)
+
+            results.append(
+                {
+                    "model": name,
+                    "n_trees": len(flat.roots),
+                    "batch_size": batch_size,
+                    "sklearn_ms": sklearn_s * 1000,
+                    "flat_ms": flat_s * 1000,
+                    "speedup": sklearn_s / flat_s,
+                    "max_abs_diff": max_diff,
+                }
+            )
+
+    print(
+        f"{'model':<17} {'batch':>7} {'sklearn ms':>11} "
+        f"{'flat ms':>9} {'speedup':>8} {'max diff':>9}"
+    )
+    for r in results:
+        print(
+            f"{r['model']:<17} {r['batch_size']:>7} {r['sklearn_ms']:>11.3f} "
+            f"{r['flat_ms']:>9.3f} {r['speedup']:>7.1f}x {r['max_abs_diff']:>9.1e}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
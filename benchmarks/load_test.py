@@ -0,0 +1,230 @@
+"""
+Load test of the inference service in each serving mode: Flask's
+development server ("dev"), gunicorn with threaded workers ("gthread") and
+gunicorn with gevent workers ("gevent").
+
+For every mode the server is started against a local model directory
+(MODEL_SOURCE_DIR, no S3), warmed up, and hit by ``--concurrency`` client
+threads over keep-alive connections for ``--duration`` seconds. Reports
+req/s and p50/p99 latency per mode. Usage:
+
+    python benchmarks/load_test.py --model-dir artifacts/model
+    python benchmarks/load_test.py --model-dir artifacts/model \
+        --modes gthread gevent --endpoint batch --batch-size 256
+
+``--url`` load-tests an already running server instead (mode "external").
+"""
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_housing import make_housing  # noqa: E402
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = {
+    "dev": ["{python}", "app.py"],
+    "gthread": [
+        "{python}", "-m", "gunicorn", "-c", "gunicorn.conf.py",
+        "--worker-class", "gthread", "app:app"
+    ],
+    "gevent": [
+        "{python}", "-m", "gunicorn", "-c", "gunicorn.conf.py",
+        "--worker-class", "gevent", "app:app"
+    ],
+}
+
+PORT = 8080
+STARTUP_TIMEOUT_S = 120
+
+
+def build_bodies(endpoint: str, batch_size: int, n: int = 200) -> list:
+    records = json.loads(
+        make_housing(n * batch_size, seed=11)
+        .drop(columns=["median_house_value"])
+        .to_json(orient="records")
+    )
+    if endpoint == "predict":
+        return [json.dumps(record).encode() for record in records[:n]]
+
+    return [
+        json.dumps(records[i:i + batch_size]).encode()
+        for i in range(0, len(records), batch_size)
+    ]
+
+
+def wait_until_healthy(host: str, port: int, process=None) -> None:
+    deadline = time.monotonic() + STARTUP_TIMEOUT_S
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=2)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError("Server did not become healthy in time")
+
+
+def run_load(
+    host: str,
+    port: int,
+    path: str,
+    bodies: list,
+    concurrency: int,
+    duration: float
+) -> dict:
+    latencies = [[] for _ in range(concurrency)]
+    errors = [0] * concurrency
+    stop_at = time.perf_counter() + duration
+    headers = {"Content-Type": "application/json"}
+
+    def client(index: int) -> None:
+        conn = http.client.HTTPConnection(host, port, timeout=30)
+        i = index
+        while time.perf_counter() < stop_at:
+            body = bodies[i % len(bodies)]
+            i += concurrency
+            start = time.perf_counter()
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                if response.status != 200:
+                    errors[index] += 1
+                    continue
+            except (OSError, http.client.HTTPException):
+                errors[index] += 1
+                conn.close()
+                conn = http.client.HTTPConnection(host, port, timeout=30)
+                continue
+            latencies[index].append(time.perf_counter() - start)
+        conn.close()
+
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(target=client, args=(i,)) for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    samples = np.concatenate([np.asarray(lat) for lat in latencies])
+    return {
+        "requests": int(len(samples)),
+        "errors": int(sum(errors)),
+        "req_per_s": len(samples) / elapsed,
+        "p50_ms": float(np.percentile(samples, 50) * 1000) if len(samples) else None,
+        "p99_ms": float(np.percentile(samples, 99) * 1000) if len(samples) else None,
+    }
+
+
+def start_server(mode: str, args) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        MODEL_SOURCE_DIR=os.path.abspath(args.model_dir),
+        MODEL_RELOAD_INTERVAL_S="0",
+        GUNICORN_BIND=f"127.0.0.1:{PORT}",
+        LOG_MODE="async",
+        LOG_PAYLOAD_SAMPLE_RATE="0",
+    )
+    if args.workers:
+        env["GUNICORN_WORKERS"] = str(args.workers)
+    if args.threads:
+        env["GUNICORN_THREADS"] = str(args.threads)
+
+    command = [part.format(python=sys.executable) for part in MODES[mode]]
+    return subprocess.Popen(
+        command,
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model-dir", default="artifacts/model")
+    parser.add_argument(
+        "--modes", nargs="+", choices=sorted(MODES), default=["dev", "gthread"]
+    )
+    parser.add_argument("--url", help="load-test a running server instead")
+    parser.add_argument(
+        "--endpoint", choices=["predict", "batch"], default="predict"
+    )
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--threads", type=int)
+    parser.add_argument("--output", help="optional JSON results file")
+    args = parser.parse_args()
+
+    path = "/predict" if args.endpoint == "predict" else "/predict/batch"
+    bodies = build_bodies(args.endpoint, args.batch_size)
+
+    if args.url:
+        url = urllib.parse.urlparse(args.url)
+        targets = [("external", url.hostname, url.port or 80)]
+    else:
+        targets = [(mode, "127.0.0.1", PORT) for mode in args.modes]
+
+    results = []
+    for mode, host, port in targets:
+        process = None if mode == "external" else start_server(mode, args)
+        try:
+            wait_until_healthy(host, port, process)
+            # Warm-up: connections, lazy imports, page faults
+            run_load(host, port, path, bodies, args.concurrency, 1.0)
+            result = run_load(
+                host, port, path, bodies, args.concurrency, args.duration
+            )
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait(timeout=60)
+
+        results.append(
+            {
+                "mode": mode,
+                "endpoint": args.endpoint,
+                "concurrency": args.concurrency,
+                **result
+            }
+        )
+
+    print(
+        f"{'mode':<9} {'requests':>9} {'errors':>7} {'req/s':>9} "
+        f"{'p50 ms':>8} {'p99 ms':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<9} {r['requests']:>9} {r['errors']:>7} "
+            f"{r['req_per_s']:>9.1f} {r['p50_ms'] or 0:>8.2f} "
+            f"{r['p99_ms'] or 0:>8.2f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
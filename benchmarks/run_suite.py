@@ -0,0 +1,305 @@
+"""
+Benchmark suite: pipeline stage times, per-candidate fit times, inference
+service cold start and /predict throughput, at one or more dataset scales
+(multiples of the 20,640-row housing dataset).
+
+Everything runs offline on synthetic data: the pipeline reads a local CSV,
+S3 is replaced by the local storage backend, MLflow logs to a file store
+and the stage cache is off. Each scale runs in its own temporary working
+directory.
+
+Results are written as JSON (a flat ``{metric: value}`` map per run) and
+compared against a stored baseline; metrics ending in ``_per_s`` are
+better when higher, all others (seconds, milliseconds) when lower. The
+exit code is 1 when any metric regressed by more than ``--tolerance``.
+
+    python benchmarks/run_suite.py --scales 1 5 --output results.json
+    python benchmarks/run_suite.py --quick --save-baseline
+    python benchmarks/run_suite.py --quick          # compare to baseline
+
+Baselines are machine-specific: record them on the hardware that is
+compared against (e.g. the CI runner), not on a laptop. A missing
+baseline is reported as a warning, or as exit code 2 with
+``--require-baseline`` (as in CI, where the quick suite gates every push).
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic_housing import BASE_ROWS, make_housing  # noqa: E402
+
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+# Fewer trees so a full suite finishes in a couple of minutes
+QUICK_ESTIMATORS = 20
+
+# Sub-second stages are noisy: a "_s" metric only counts as regressed if it
+# also got slower by at least this many seconds
+MIN_REGRESSION_S = 0.05
+
+# Runs in a fresh interpreter in the scale's working directory: model
+# cold start, then /predict and /predict/batch through the Flask test
+# client (no network stack, so this measures the app itself)
+SERVICE_PROBE = """
+import json, sys, time
+import numpy as np
+
+start = time.perf_counter()
+import app
+import_seconds = time.perf_counter() - start
+
+records = json.load(open(sys.argv[1]))
+client = app.app.test_client()
+for record in records[:20]:
+    client.post("/predict", json=record)
+
+latencies = []
+start = time.perf_counter()
+for record in records[:{n_requests}]:
+    t = time.perf_counter()
+    response = client.post("/predict", json=record)
+    latencies.append(time.perf_counter() - t)
+    assert response.status_code == 200, response.get_data(as_text=True)
+elapsed = time.perf_counter() - start
+
+batch = records[:{batch_size}]
+batch_times = []
+for _ in range(5):
+    t = time.perf_counter()
+    response = client.post("/predict/batch", json=batch)
+    batch_times.append(time.perf_counter() - t)
+    assert response.status_code == 200, response.get_data(as_text=True)
+
+print(json.dumps({{
+    "import_app_s": import_seconds,
+    "model_load_s": app.model_store.get().load_seconds,
+    "predict_req_per_s": len(latencies) / elapsed,
+    "predict_p50_ms": float(np.percentile(latencies, 50) * 1000),
+    "predict_p99_ms": float(np.percentile(latencies, 99) * 1000),
+    "batch_rows_per_s": len(batch) / float(np.median(batch_times))
+}}))
+"""
+
+
+def prepare_workdir(workdir: str, n_rows: int, quick: bool) -> None:
+    """
+    Synthetic source data plus a config pointing every external service
+    at a local stand-in.
+    """
+    with open(os.path.join(ROOT, "config", "config.yaml"), "r") as f:
+        cfg = yaml.safe_load(f)
+
+    source = os.path.join(workdir, "housing.csv")
+    make_housing(n_rows).to_csv(source, index=False)
+
+    cfg["data"]["url"] = source
+    cfg["pipeline"]["stage_cache"]["enabled"] = False
+    cfg["mlflow"]["tracking_uri"] = f"file://{os.path.join(workdir, 'mlruns')}"
+    cfg["s3"]["backend"] = "local"
+    cfg["s3"]["local_root"] = os.path.join(workdir, "s3")
+    cfg["metrics"]["timings_enabled"] = True
+
+    if quick:
+        for params in cfg["model"]["candidates"].values():
+            if "n_estimators" in params:
+                params["n_estimators"] = QUICK_ESTIMATORS
+
+    os.makedirs(os.path.join(workdir, "config"), exist_ok=True)
+    with open(os.path.join(workdir, "config", "config.yaml"), "w") as f:
+        yaml.safe_dump(cfg, f)
+
+
+def run_pipeline_in(workdir: str) -> dict:
+    """
+    Run the full pipeline in ``workdir`` (in a subprocess, so module-level
+    state and the logger do not leak between scales) and return its stage
+    timings.
+    """
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "demo.py")],
+        cwd=workdir,
+        env=dict(os.environ, PYTHONPATH=ROOT, MLFLOW_ALLOW_FILE_STORE="true"),
+        capture_output=True,
+        text=True
+    )
+    wall = time.perf_counter() - start
+    if process.returncode != 0:
+        sys.stderr.write(process.stderr[-5000:])
+        raise RuntimeError(f"Pipeline failed in {workdir}")
+
+    with open(os.path.join(workdir, "config", "config.yaml"), "r") as f:
+        metrics_dir = yaml.safe_load(f)["metrics"]["metrics_dir"]
+    with open(os.path.join(workdir, metrics_dir, "pipeline_timings.json")) as f:
+        timings = json.load(f)
+
+    results = {"pipeline_wall_s": wall}
+    for name, seconds in timings.items():
+        if name.startswith("fit_"):
+            results[f"fit/{name[4:]}_s"] = seconds
+        else:
+            results[f"stage/{name}_s"] = seconds
+    return results
+
+
+def probe_service(workdir: str, n_requests: int, batch_size: int) -> dict:
+    records_path = os.path.join(workdir, "requests.json")
+    records = make_housing(max(n_requests, batch_size) + 20, seed=7)
+    records.drop(columns=["median_house_value"]).to_json(
+        records_path, orient="records"
+    )
+
+    with open(os.path.join(workdir, "config", "config.yaml"), "r") as f:
+        model_dir = yaml.safe_load(f)["model"]["model_dir"]
+
+    probe = SERVICE_PROBE.format(n_requests=n_requests, batch_size=batch_size)
+    process = subprocess.run(
+        [sys.executable, "-c", probe, records_path],
+        cwd=workdir,
+        env=dict(
+            os.environ,
+            PYTHONPATH=ROOT,
+            MODEL_SOURCE_DIR=os.path.join(workdir, model_dir),
+            MODEL_RELOAD_INTERVAL_S="0",
+            LOG_PAYLOAD_SAMPLE_RATE="0"
+        ),
+        capture_output=True,
+        text=True
+    )
+    if process.returncode != 0:
+        sys.stderr.write(process.stderr[-5000:])
+        raise RuntimeError(f"Service probe failed in {workdir}")
+
+    service = json.loads(process.stdout.strip().splitlines()[-1])
+    return {f"service/{name}": value for name, value in service.items()}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Rows of (metric, baseline, current, relative change, regressed).
+    """
+    rows = []
+    for metric, current in sorted(results.items()):
+        previous = baseline.get(metric)
+        if previous is None or current is None or not previous:
+            continue
+
+        change = (current - previous) / previous
+        if metric.endswith("_per_s"):
+            regressed = change < -tolerance
+        else:
+            regressed = change > tolerance
+            if metric.endswith("_s"):
+                regressed = regressed and current - previous >= MIN_REGRESSION_S
+        rows.append((metric, previous, current, change, regressed))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1])
+    parser.add_argument(
+        "--quick", action="store_true",
+        help=f"train {QUICK_ESTIMATORS}-tree ensembles instead of the configured size"
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--output", help="JSON results file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline", action="store_true",
+        help="store these results as the new baseline"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument(
+        "--require-baseline", action="store_true",
+        help="exit with code 2 when there is no baseline to compare against"
+    )
+    args = parser.parse_args()
+
+    has_baseline = os.path.exists(args.baseline)
+    if args.require_baseline and not has_baseline and not args.save_baseline:
+        sys.stderr.write(f"Baseline {args.baseline} not found\n")
+        sys.exit(2)
+
+    results = {}
+    for scale in args.scales:
+        n_rows = BASE_ROWS * scale
+        print(f"Scale x{scale} ({n_rows} rows)", flush=True)
+
+        with tempfile.TemporaryDirectory() as workdir:
+            prepare_workdir(workdir, n_rows, args.quick)
+            scale_results = run_pipeline_in(workdir)
+            scale_results.update(
+                probe_service(workdir, args.requests, args.batch_size)
+            )
+
+        for metric, value in scale_results.items():
+            results[f"x{scale}/{metric}"] = value
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "quick": args.quick,
+            "scales": args.scales
+        },
+        "results": results
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+
+    regressions = []
+    if has_baseline and not args.save_baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        if baseline["meta"].get("quick") != args.quick:
+            print("Warning: baseline was recorded with a different --quick setting")
+
+        rows = compare(results, baseline["results"], args.tolerance)
+        print(f"{'metric':<48} {'baseline':>10} {'current':>10} {'change':>8}")
+        for metric, previous, current, change, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(
+                f"{metric:<48} {previous:>10.4g} {current:>10.4g} "
+                f"{change:>+7.1%}{flag}"
+            )
+        regressions = [row[0] for row in rows if row[4]]
+    else:
+        print(f"{'metric':<48} {'value':>10}")
+        for metric, value in sorted(results.items()):
+            print(f"{metric:<48} {value:>10.4g}")
+        if not args.save_baseline:
+            sys.stderr.write(
+                f"WARNING: baseline {args.baseline} not found; nothing was "
+                f"compared and no regression can be detected. Record one "
+                f"with --save-baseline.\n"
+            )
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=4)
+        print(f"Baseline saved to {args.baseline}")
+
+    if regressions:
+        print(f"{len(regressions)} metric(s) regressed beyond {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
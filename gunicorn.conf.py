@@ -0,0 +1,69 @@
+"""
+Production serving configuration for the inference service:
+
+    gunicorn -c gunicorn.conf.py app:app
+
+The app is imported once in the master (``preload_app``), so the model is
+loaded a single time and shared copy-on-write by the forked workers; the
+memory-mapped serving artifact is shared through the page cache either
+way. Per-process background threads (the model watcher) are started in
+each worker after fork.
+
+Every setting can be overridden from the environment. The default worker
+class is "gthread" (CPU-bound single-row traffic); GUNICORN_WORKER_CLASS=gevent
+serves many slow, I/O-bound batch clients per worker instead.
+
+Metrics, /drift and /stats/* are process-local and are not aggregated
+across workers. With more than one worker a scrape reaches whichever
+worker accepts it; every sample then carries a ``worker`` label
+(METRICS_WORKER_LABEL) so series stay separate, but each scrape only sees
+one worker and instance totals (``sum without (worker) (...)``) are
+approximate. GUNICORN_WORKERS=1 (scaling out with instances instead)
+gives exact per-instance metrics.
+"""
+import multiprocessing
+import os
+
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8080")
+
+# Prediction is CPU-bound, so one worker per core; capped because every
+# worker holds its own copy of the non-shared model state
+MAX_DEFAULT_WORKERS = int(os.environ.get("GUNICORN_MAX_WORKERS", 8))
+workers = int(
+    os.environ.get(
+        "GUNICORN_WORKERS",
+        min(multiprocessing.cpu_count(), MAX_DEFAULT_WORKERS)
+    )
+)
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+# gevent only: concurrent connections per worker
+worker_connections = int(os.environ.get("GUNICORN_WORKER_CONNECTIONS", 1000))
+
+preload_app = True
+
+# Read by app.py at import, which preload_app runs after this file
+if workers > 1:
+    os.environ.setdefault("METRICS_WORKER_LABEL", "1")
+
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE_S", 5))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT_S", 60))
+# In-flight requests get this long to finish on SIGTERM / worker restart
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT_S", 30))
+
+# Recycle workers now and then; jitter avoids restarting them all at once
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 0))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 0))
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG") or None
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+
+def post_fork(server, worker):
+    # Threads do not survive fork, so each worker starts its own
+    import app
+
+    app.start_background_services()
+    server.log.info(f"Worker {worker.pid} started background services")
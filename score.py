@@ -0,0 +1,38 @@
+import argparse
+import json
+
+from src.pipeline.batch_scoring import score_file
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Score a CSV/Parquet/Arrow file with the promoted model"
+    )
+    parser.add_argument("input_path")
+    parser.add_argument("output_path")
+    parser.add_argument(
+        "--model-dir",
+        help="score with a local model directory instead of the promoted "
+             "model in S3 (e.g. an unpromoted training run)"
+    )
+    parser.add_argument("--chunk-size", type=int)
+    parser.add_argument(
+        "--workers", type=int, help="scoring processes (0 = all cores)"
+    )
+    parser.add_argument(
+        "--columns", nargs="+",
+        help="input columns copied to the output (default: all)"
+    )
+    parser.add_argument("--config", default="config/config.yaml")
+    args = parser.parse_args()
+
+    summary = score_file(
+        input_path=args.input_path,
+        output_path=args.output_path,
+        model_dir=args.model_dir,
+        chunk_size=args.chunk_size,
+        n_workers=args.workers,
+        keep_columns=args.columns,
+        config_path=args.config
+    )
+    print(json.dumps(summary, indent=4))
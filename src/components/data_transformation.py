@@ -1,15 +1,17 @@
 import os
 import sys
-import pandas as pd
 from sklearn.model_selection import train_test_split
 
 from src.logger.logger import logger
 from src.exception.exception import CustomException
+from src.utils.frame_io import artifact_path
+from src.utils.artifact_context import ArtifactContext
 
 
 class DataTransformation:
-    def __init__(self, cfg: dict):
+    def __init__(self, cfg: dict, context: ArtifactContext = None):
         self.cfg = cfg
+        self.context = context or ArtifactContext(keep_in_memory=False)
         os.makedirs(self.cfg["processed_dir"], exist_ok=True)
         logger.info(
             f"DataTransformation initialized with processed_dir={self.cfg['processed_dir']}"
@@ -19,7 +21,7 @@ class DataTransformation:
         try:
             logger.info(f"Starting train-test split using raw data at {raw_path}")
 
-            df = pd.read_csv(raw_path)
+            df = self.context.read(raw_path)
             logger.info(f"Raw dataset loaded with shape {df.shape}")
 
             train, test = train_test_split(
@@ -28,11 +30,12 @@ class DataTransformation:
                 random_state=42
             )
 
-            train_path = os.path.join(self.cfg["processed_dir"], "train.csv")
-            test_path = os.path.join(self.cfg["processed_dir"], "test.csv")
+            fmt = self.cfg.get("artifact_format", "csv")
+            train_path = artifact_path(self.cfg["processed_dir"], "train", fmt)
+            test_path = artifact_path(self.cfg["processed_dir"], "test", fmt)
 
-            train.to_csv(train_path, index=False)
-            test.to_csv(test_path, index=False)
+            self.context.write(train, train_path)
+            self.context.write(test, test_path)
 
             logger.info(
                 f"Train-test split completed successfully. "
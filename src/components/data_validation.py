@@ -1,31 +1,142 @@
 import os
 import sys
 import json
+import math
+
+import numpy as np
 import pandas as pd
 
 from src.logger.logger import logger
 from src.exception.exception import CustomException
+from src.utils.artifact_context import ArtifactContext
+
+
+class _RowHashFilter:
+    """
+    Fixed-size Bloom filter over 64-bit row hashes.
+
+    Sized for ``capacity`` distinct rows at ``error_rate`` false positives;
+    memory does not grow with the input. Beyond capacity the duplicate
+    count becomes an over-estimate.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        n_bits = int(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.n_bits = max(n_bits, 64)
+        self.n_hashes = max(1, round(self.n_bits / capacity * math.log(2)))
+        self.bits = np.zeros((self.n_bits + 7) // 8, dtype=np.uint8)
+
+    def _positions(self, hashes: np.ndarray) -> np.ndarray:
+        # Double hashing: position_i = h1 + i * h2 (mod n_bits)
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        i = np.arange(self.n_hashes, dtype=np.uint64)
+        return (h1[:, None] + i[None, :] * h2[:, None]) % np.uint64(self.n_bits)
+
+    def add(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Insert unique hashes; returns a mask of those already present.
+        """
+        positions = self._positions(hashes)
+        byte_index = (positions >> np.uint64(3)).astype(np.int64)
+        bit_mask = (np.uint8(1) << (positions & np.uint64(7)).astype(np.uint8))
+
+        seen = ((self.bits[byte_index] & bit_mask) != 0).all(axis=1)
+        np.bitwise_or.at(self.bits, byte_index.ravel(), bit_mask.ravel())
+        return seen
+
+
+class ValidationStats:
+    """
+    Validation statistics accumulated one chunk at a time, so ingestion
+    can compute them in the same single pass that writes the data.
+
+    Row/column and missing counts are exact. Duplicates are found by
+    hashing rows: exact within a chunk, and across chunks via a
+    fixed-memory Bloom filter.
+    """
+
+    def __init__(
+        self,
+        duplicate_capacity: int = 10_000_000,
+        duplicate_error_rate: float = 0.001
+    ):
+        self.row_count = 0
+        self.columns = None
+        self.missing_values = None
+        self.duplicate_rows = 0
+
+        self.duplicate_capacity = duplicate_capacity
+        self.duplicate_error_rate = duplicate_error_rate
+        self._seen = None
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+            self.missing_values = pd.Series(
+                0, index=chunk.columns, dtype=np.int64
+            )
+            self._seen = _RowHashFilter(
+                self.duplicate_capacity, self.duplicate_error_rate
+            )
+
+        self.row_count += len(chunk)
+        self.missing_values = self.missing_values.add(
+            chunk.isnull().sum(), fill_value=0
+        ).astype(np.int64)
+
+        hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+        unique_hashes = np.unique(hashes)
+        self.duplicate_rows += len(hashes) - len(unique_hashes)
+        self.duplicate_rows += int(self._seen.add(unique_hashes).sum())
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "ValidationStats":
+        """
+        Exact statistics for a DataFrame that is already in memory.
+        """
+        stats = cls()
+        stats.row_count = df.shape[0]
+        stats.columns = list(df.columns)
+        stats.missing_values = df.isnull().sum()
+        stats.duplicate_rows = int(df.duplicated().sum())
+        return stats
 
 
 class DataValidation:
-    def __init__(self, cfg: dict):
+    def __init__(self, cfg: dict, context: ArtifactContext = None):
         self.cfg = cfg
+        self.context = context or ArtifactContext(keep_in_memory=False)
         self.validation_dir = os.path.join("artifacts", "metrics")
         os.makedirs(self.validation_dir, exist_ok=True)
+        self.report_path = os.path.join(
+            self.validation_dir, "data_validation_report.json"
+        )
 
         logger.info("DataValidation initialized")
 
-    def validate(self, raw_data_path: str) -> bool:
+    def validate(self, raw_data_path: str, stats: ValidationStats = None) -> bool:
+        """
+        Validate the raw dataset. ``stats`` computed during streaming
+        ingestion are used as-is instead of loading the file again.
+        """
         try:
             logger.info(f"Starting data validation for file: {raw_data_path}")
 
-            df = pd.read_csv(raw_data_path)
-            logger.info(f"Dataset loaded with shape {df.shape}")
+            if stats is None:
+                df = self.context.read(raw_data_path)
+                logger.info(f"Dataset loaded with shape {df.shape}")
+                stats = ValidationStats.from_frame(df)
+            else:
+                logger.info(
+                    f"Using statistics collected during ingestion for "
+                    f"{stats.row_count} rows"
+                )
 
             validation_report = {
                 "file_path": raw_data_path,
-                "row_count": df.shape[0],
-                "column_count": df.shape[1],
+                "row_count": int(stats.row_count),
+                "column_count": len(stats.columns),
                 "missing_values": {},
                 "duplicate_rows": 0,
                 "target_column_present": False,
@@ -33,20 +144,23 @@ class DataValidation:
             }
 
             # 1. Check missing values
-            missing_counts = df.isnull().sum()
+            missing_counts = stats.missing_values
             missing_columns = missing_counts[missing_counts > 0]
 
-            validation_report["missing_values"] = missing_columns.to_dict()
+            validation_report["missing_values"] = {
+                col: int(count) for col, count in missing_columns.items()
+            }
 
             if missing_columns.any():
                 logger.warning(
-                    f"Missing values found in columns: {missing_columns.to_dict()}"
+                    f"Missing values found in columns: "
+                    f"{validation_report['missing_values']}"
                 )
             else:
                 logger.info("No missing values found")
 
             # 2. Check duplicate rows
-            duplicate_count = df.duplicated().sum()
+            duplicate_count = stats.duplicate_rows
             validation_report["duplicate_rows"] = int(duplicate_count)
 
             if duplicate_count > 0:
@@ -56,7 +170,7 @@ class DataValidation:
 
             # 3. Check target column existence
             target_col = self.cfg["target"]
-            if target_col in df.columns:
+            if target_col in stats.columns:
                 validation_report["target_column_present"] = True
                 logger.info(f"Target column '{target_col}' is present")
             else:
@@ -66,15 +180,12 @@ class DataValidation:
             # Final status
             validation_report["status"] = "PASSED"
 
-            report_path = os.path.join(
-                self.validation_dir, "data_validation_report.json"
-            )
-            with open(report_path, "w") as f:
+            with open(self.report_path, "w") as f:
                 json.dump(validation_report, f, indent=4)
 
             logger.info(
                 f"Data validation completed successfully. "
-                f"Report saved at {report_path}"
+                f"Report saved at {self.report_path}"
             )
 
             return True
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from src.components.reference_profile import ReferenceProfile
+
+
+class DriftEngine:
+    """
+    Scores data against a ReferenceProfile.
+
+    A batch is reduced to per-feature bin counts with one vectorized pass
+    per column, after which scoring only touches the (small) histograms,
+    so cost grows linearly with rows and never needs the training data.
+    """
+
+    def __init__(self, profile: ReferenceProfile, psi_threshold: float = 0.2):
+        self.profile = profile
+        self.psi_threshold = psi_threshold
+
+    def bin_frame(self, df: pd.DataFrame) -> dict:
+        """
+        Bin counts per profiled feature; absent columns count as missing.
+        """
+        counts = {}
+        for feature in self.profile.features:
+            if feature in df.columns:
+                values = df[feature].to_numpy()
+            else:
+                values = np.full(len(df), np.nan)
+            counts[feature] = self.profile.bin_counts(feature, values)
+        return counts
+
+    def score_counts(self, counts: dict, n_rows: int) -> dict:
+        features = {}
+        drifted = []
+        for feature, feature_counts in counts.items():
+            scores = self.profile.score(feature, feature_counts)
+            features[feature] = scores
+            if scores["psi"] is not None and scores["psi"] > self.psi_threshold:
+                drifted.append(feature)
+
+        return {
+            "n_rows": n_rows,
+            "reference_rows": self.profile.n_rows,
+            "psi_threshold": self.psi_threshold,
+            "features": features,
+            "drifted_features": drifted,
+            "share_drifted": len(drifted) / max(len(features), 1)
+        }
+
+    def score_frame(self, df: pd.DataFrame) -> dict:
+        return self.score_counts(self.bin_frame(df), len(df))
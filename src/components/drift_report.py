@@ -1,53 +1,94 @@
 import os
 import sys
-import pandas as pd
-
-from evidently.report import Report
-from evidently.metric_preset import DataDriftPreset
+import json
 
 from src.logger.logger import logger
 from src.exception.exception import CustomException
+from src.utils.artifact_context import ArtifactContext
+from src.components.drift_engine import DriftEngine
+from src.components.feature_encoder import FeatureEncoder
+from src.components.reference_profile import ReferenceProfile
 
 
 class DriftReport:
-    def __init__(self, cfg: dict):
+    def __init__(self, cfg: dict, context: ArtifactContext = None):
         self.cfg = cfg
+        self.context = context or ArtifactContext(keep_in_memory=False)
         os.makedirs(self.cfg["reports_dir"], exist_ok=True)
+        os.makedirs(self.cfg["metrics_dir"], exist_ok=True)
+
+        # The Evidently HTML report is optional; the JSON scores are not
+        self.html = self.cfg.get("drift_html", False)
+        self.psi_threshold = self.cfg.get("drift_psi_threshold", 0.2)
+
+        self.metrics_path = os.path.join(
+            self.cfg["metrics_dir"],
+            "data_drift.json"
+        )
+        self.report_path = os.path.join(
+            self.cfg["reports_dir"],
+            "data_drift_report.html"
+        )
         logger.info("DriftReport initialized")
 
-    def generate(self, train_path: str, test_path: str) -> None:
+    @property
+    def outputs(self) -> list:
+        if self.html:
+            return [self.metrics_path, self.report_path]
+        return [self.metrics_path]
+
+    def generate(
+        self,
+        train_path: str,
+        test_path: str,
+        profile_path: str = None
+    ) -> dict:
+        """
+        Score the test data against the training reference profile. The
+        training data is only read when no profile is given or the HTML
+        report is enabled.
+        """
         try:
-            logger.info("Starting Evidently data drift analysis")
+            logger.info("Starting data drift analysis")
 
-            train_df = pd.read_csv(train_path)
-            test_df = pd.read_csv(test_path)
+            test_df = self.context.read(test_path)
+            train_df = None
 
-            logger.info(
-                f"Reference data shape: {train_df.shape}, "
-                f"Current data shape: {test_df.shape}"
-            )
+            if profile_path is not None and os.path.exists(profile_path):
+                profile = ReferenceProfile.load(profile_path)
+                logger.info(f"Reference profile loaded from {profile_path}")
+            else:
+                train_df = self.context.read(train_path)
+                encoder = FeatureEncoder(target=None).fit(train_df)
+                profile = ReferenceProfile.from_frame(
+                    train_df,
+                    numeric_columns=encoder.numeric_columns,
+                    categorical_columns=encoder.categorical_columns
+                )
+                logger.info(
+                    f"Reference profile built from {train_path} "
+                    f"with shape {train_df.shape}"
+                )
 
-            report = Report(
-                metrics=[
-                    DataDriftPreset()
-                ]
-            )
+            drift = DriftEngine(
+                profile, psi_threshold=self.psi_threshold
+            ).score_frame(test_df)
 
-            report.run(
-                reference_data=train_df,
-                current_data=test_df
-            )
+            with open(self.metrics_path, "w") as f:
+                json.dump(drift, f, indent=4)
 
-            report_path = os.path.join(
-                self.cfg["reports_dir"],
-                "data_drift_report.html"
+            logger.info(
+                f"Drift scores for {drift['n_rows']} rows saved at "
+                f"{self.metrics_path}. Drifted features: "
+                f"{drift['drifted_features']}"
             )
 
-            report.save_html(report_path)
+            if self.html:
+                if train_df is None:
+                    train_df = self.context.read(train_path)
+                self._save_html(train_df, test_df)
 
-            logger.info(
-                f"Evidently data drift report generated at {report_path}"
-            )
+            return drift
 
         except Exception as e:
             logger.error(
@@ -55,3 +96,29 @@ class DriftReport:
                 exc_info=True
             )
             raise CustomException(e, sys)
+
+    def _save_html(self, train_df, test_df) -> None:
+        from evidently.report import Report
+        from evidently.metric_preset import DataDriftPreset
+
+        logger.info(
+            f"Reference data shape: {train_df.shape}, "
+            f"Current data shape: {test_df.shape}"
+        )
+
+        report = Report(
+            metrics=[
+                DataDriftPreset()
+            ]
+        )
+
+        report.run(
+            reference_data=train_df,
+            current_data=test_df
+        )
+
+        report.save_html(self.report_path)
+
+        logger.info(
+            f"Evidently data drift report generated at {self.report_path}"
+        )
@@ -0,0 +1,257 @@
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src.logger.logger import logger
+
+
+class RegressionMetrics:
+    """
+    R2, MAE and RMSE accumulated chunk by chunk in constant memory.
+
+    The target mean and sum of squares are merged per chunk with Chan's
+    parallel update, so R2 does not suffer from the cancellation of a
+    naive sum(y^2) - n * mean^2 on large test sets.
+    """
+
+    def __init__(self):
+        self.n_rows = 0
+        self.y_mean = 0.0
+        self.y_m2 = 0.0  # sum of squared deviations from the mean
+        self.sse = 0.0
+        self.sae = 0.0
+
+    def update(self, y_true, y_pred) -> None:
+        y_true = np.asarray(y_true, dtype=np.float64)
+        y_pred = np.asarray(y_pred, dtype=np.float64)
+        n = len(y_true)
+        if n == 0:
+            return
+
+        residual = y_true - y_pred
+        self.sse += float(residual @ residual)
+        self.sae += float(np.abs(residual).sum())
+
+        chunk_mean = float(y_true.mean())
+        chunk_m2 = float(((y_true - chunk_mean) ** 2).sum())
+        total = self.n_rows + n
+        delta = chunk_mean - self.y_mean
+        self.y_m2 += chunk_m2 + delta * delta * self.n_rows * n / total
+        self.y_mean += delta * n / total
+        self.n_rows = total
+
+    def result(self) -> dict:
+        if self.n_rows == 0:
+            return {"r2": None, "mae": None, "rmse": None, "n_rows": 0}
+
+        r2 = 1.0 - self.sse / self.y_m2 if self.y_m2 > 0 else float("nan")
+        return {
+            "r2": r2,
+            "mae": self.sae / self.n_rows,
+            "rmse": math.sqrt(self.sse / self.n_rows),
+            "n_rows": self.n_rows
+        }
+
+
+def _poisson_table(size: int = 1 << 16) -> np.ndarray:
+    # Inverse CDF of Poisson(1) on a uniform uint16 grid: indexing this
+    # table with random uint16s is several times faster than rng.poisson
+    pmf = [math.exp(-1.0) / math.factorial(k) for k in range(16)]
+    cdf = np.cumsum(pmf)
+    grid = (np.arange(size) + 0.5) / size
+    return np.searchsorted(cdf, grid).astype(np.float64)
+
+
+class PairedBootstrap:
+    """
+    Paired bootstrap of the challenger-vs-champion difference in R2 and
+    RMSE, computed while streaming.
+
+    Uses the Poisson bootstrap: every resample gives each row an
+    independent Poisson(1) weight instead of drawing n rows with
+    replacement, which is equivalent for large n and lets chunks be
+    folded in as they arrive. Per resample only five weighted sums are
+    kept (weight, y, y^2 and both squared errors), each updated with one
+    (resamples x rows) @ (rows x 5) product. Both models share the weights,
+    so the comparison is paired.
+    """
+
+    # Rows per weight block; bounds the weight matrix to ~32 MB at 2000
+    # resamples
+    BLOCK_ROWS = 2048
+
+    _TABLE = None
+
+    def __init__(self, n_resamples: int = 2000, seed: int = 42):
+        self.n_resamples = n_resamples
+        self.rng = np.random.default_rng(seed)
+        self.sums = np.zeros((n_resamples, 5), dtype=np.float64)
+        # y is centered on the first chunk's mean so the variance sums do
+        # not cancel catastrophically
+        self.center = None
+
+        if PairedBootstrap._TABLE is None:
+            PairedBootstrap._TABLE = _poisson_table()
+
+    def update(self, y_true, challenger_pred, champion_pred) -> None:
+        y_true = np.asarray(y_true, dtype=np.float64)
+        if len(y_true) == 0:
+            return
+        if self.center is None:
+            self.center = float(y_true.mean())
+
+        y = y_true - self.center
+        columns = np.column_stack(
+            [
+                np.ones_like(y),
+                y,
+                y * y,
+                (y_true - challenger_pred) ** 2,
+                (y_true - champion_pred) ** 2
+            ]
+        )
+
+        for start in range(0, len(y), self.BLOCK_ROWS):
+            block = columns[start:start + self.BLOCK_ROWS]
+            draws = self.rng.integers(
+                0, len(self._TABLE), (self.n_resamples, len(block)),
+                dtype=np.uint16
+            )
+            self.sums += self._TABLE[draws] @ block
+
+    def result(self, confidence: float = 0.95) -> dict:
+        weight, wy, wy2, sse_new, sse_old = self.sums.T
+        valid = weight > 0
+        weight, wy, wy2 = weight[valid], wy[valid], wy2[valid]
+        sse_new, sse_old = sse_new[valid], sse_old[valid]
+
+        sst = wy2 - wy * wy / weight
+        r2_diff = (sse_old - sse_new) / sst
+        rmse_diff = np.sqrt(sse_new / weight) - np.sqrt(sse_old / weight)
+
+        tail = (1.0 - confidence) / 2.0
+        quantiles = [tail, 1.0 - tail]
+        return {
+            "n_resamples": int(valid.sum()),
+            "confidence": confidence,
+            "r2_diff_mean": float(r2_diff.mean()),
+            "r2_diff_ci": np.quantile(r2_diff, quantiles).tolist(),
+            "rmse_diff_mean": float(rmse_diff.mean()),
+            "rmse_diff_ci": np.quantile(rmse_diff, quantiles).tolist(),
+            # Share of resamples in which the challenger has the higher R2
+            "p_challenger_better": float((r2_diff > 0).mean())
+        }
+
+
+class ChampionChallengerEvaluator:
+    """
+    Scores the challenger (new model) and the champion (production model)
+    on one pass over the test chunks.
+
+    The champion is fetched and loaded on a background thread while the
+    challenger is already scoring. Until it is ready, up to
+    ``max_pending_chunks`` raw chunks are held back for it; after that the
+    loop waits. Once loaded, the champion scores each chunk on the worker
+    thread while the challenger scores it on the calling thread (tree
+    ensembles release the GIL while predicting).
+    """
+
+    def __init__(
+        self,
+        challenger,
+        encoder,
+        target: str,
+        max_pending_chunks: int = 4,
+        bootstrap: PairedBootstrap = None
+    ):
+        self.challenger = challenger
+        self.encoder = encoder
+        self.target = target
+        self.max_pending_chunks = max_pending_chunks
+        self.bootstrap = bootstrap
+
+    def run(self, chunks, load_champion) -> tuple:
+        """
+        Consume ``chunks`` (DataFrames with features and target).
+        ``load_champion`` returns ``(model, encoder_or_None)`` and may
+        raise when there is no production model.
+
+        Returns ``(challenger_metrics, champion_metrics_or_None)``.
+        """
+        challenger_metrics = RegressionMetrics()
+        champion_metrics = RegressionMetrics()
+
+        def record_champion(y, challenger_pred, champion_pred):
+            champion_metrics.update(y, champion_pred)
+            if self.bootstrap is not None:
+                self.bootstrap.update(y, challenger_pred, champion_pred)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            champion_future = executor.submit(load_champion)
+            champion = None
+            champion_failed = False
+            pending = deque()
+
+            def resolve_champion():
+                nonlocal champion, champion_failed
+                try:
+                    champion = champion_future.result()
+                except Exception:
+                    logger.warning(
+                        "No existing production model found in S3. "
+                        "Assuming first deployment."
+                    )
+                    champion_failed = True
+                    pending.clear()
+                    return
+
+                # Catch up on the chunks that arrived during the download
+                while pending:
+                    chunk, y, challenger_pred = pending.popleft()
+                    record_champion(
+                        y, challenger_pred,
+                        self._predict_champion(champion, chunk)
+                    )
+
+            for chunk in chunks:
+                y = chunk[self.target].to_numpy(dtype=np.float64)
+
+                if champion is None and not champion_failed:
+                    if (
+                        champion_future.done()
+                        or len(pending) >= self.max_pending_chunks
+                    ):
+                        resolve_champion()
+
+                champion_scoring = None
+                if champion is not None:
+                    champion_scoring = executor.submit(
+                        self._predict_champion, champion, chunk
+                    )
+
+                challenger_pred = self.challenger.predict(
+                    self.encoder.transform(chunk)
+                )
+                challenger_metrics.update(y, challenger_pred)
+
+                if champion_scoring is not None:
+                    record_champion(
+                        y, challenger_pred, champion_scoring.result()
+                    )
+                elif not champion_failed:
+                    pending.append((chunk, y, challenger_pred))
+
+            if champion is None and not champion_failed:
+                resolve_champion()
+
+        return (
+            challenger_metrics.result(),
+            None if champion_failed else champion_metrics.result()
+        )
+
+    def _predict_champion(self, champion: tuple, chunk) -> np.ndarray:
+        # The champion is scored with the encoder it was trained with
+        model, encoder = champion
+        return model.predict((encoder or self.encoder).transform(chunk))
@@ -0,0 +1,251 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+
+
+class FeatureEncoder:
+    """
+    Fitted mapping from raw housing records to the model's feature matrix.
+
+    The column layout (numeric columns first, then one-hot columns named
+    like ``pd.get_dummies`` would) is fixed at fit time, so training,
+    evaluation and serving always agree on it. Missing numeric values are
+    filled with the training median; unseen categories encode as all zeros.
+    """
+
+    def __init__(self, target: str):
+        self.target = target
+        self.numeric_columns = []
+        self.categorical_columns = []
+        self.categories = {}
+        self.feature_names = []
+        self.fill_values = None
+
+    # -------------------- Fitting --------------------
+    def fit(self, df: pd.DataFrame) -> "FeatureEncoder":
+        features = df.drop(columns=[self.target], errors="ignore")
+
+        self.numeric_columns = [
+            col for col in features.columns
+            if pd.api.types.is_numeric_dtype(features[col])
+        ]
+        self.categorical_columns = [
+            col for col in features.columns
+            if col not in self.numeric_columns
+        ]
+        self.categories = {
+            col: sorted(features[col].dropna().astype(str).unique().tolist())
+            for col in self.categorical_columns
+        }
+
+        self.feature_names = list(self.numeric_columns)
+        for col in self.categorical_columns:
+            self.feature_names.extend(
+                f"{col}_{category}" for category in self.categories[col]
+            )
+
+        medians = features[self.numeric_columns].median()
+        self.fill_values = medians.fillna(0.0).to_numpy(dtype=np.float64)
+
+        self._build_lookups()
+        return self
+
+    def _build_lookups(self) -> None:
+        # Precomputed positions so encoding a record is plain dict lookups
+        self._numeric_index = list(enumerate(self.numeric_columns))
+        self._category_index = []
+        offset = len(self.numeric_columns)
+        for col in self.categorical_columns:
+            lookup = {
+                category: offset + i
+                for i, category in enumerate(self.categories[col])
+            }
+            self._category_index.append((col, lookup))
+            offset += len(lookup)
+
+        self._template = np.zeros(self.n_features, dtype=np.float64)
+        self._template[:len(self.numeric_columns)] = self.fill_values
+
+    @property
+    def n_features(self) -> int:
+        return len(self.feature_names)
+
+    # -------------------- Encoding --------------------
+    def encode_record(self, record: dict, out: np.ndarray = None) -> np.ndarray:
+        """
+        Encode one raw record without building a DataFrame, into ``out``
+        (e.g. a row of a preallocated matrix) when given.
+
+        Raises KeyError for a missing feature, ValueError/TypeError for a
+        numeric value that is not a number and TypeError for a categorical
+        value that is neither a string nor null.
+        """
+        if out is None:
+            row = self._template.copy()
+        else:
+            row = out
+            row[:] = self._template
+
+        for i, col in self._numeric_index:
+            value = record[col]
+            if isinstance(value, bool):
+                raise TypeError(
+                    f"expected a number for feature {col}, got {value!r}"
+                )
+            if value is not None:
+                value = float(value)
+                if value == value:  # NaN keeps the training median
+                    row[i] = value
+
+        for col, lookup in self._category_index:
+            value = record[col]
+            if value is None:
+                continue  # like an unseen category: all zeros
+            if not isinstance(value, str):
+                raise TypeError(
+                    f"expected a string for feature {col}, got {value!r}"
+                )
+            position = lookup.get(value)
+            if position is not None:
+                row[position] = 1.0
+
+        return row
+
+    def encode_records(self, records: list):
+        """
+        Encode a list of raw records into one matrix.
+
+        Returns ``(X, row_index, errors)`` where failing rows are left out
+        of ``X`` and reported by their position in ``records``.
+        """
+        X = np.empty((len(records), self.n_features), dtype=np.float64)
+        row_index = []
+        errors = []
+
+        for i, record in enumerate(records):
+            if not isinstance(record, dict):
+                errors.append({"index": i, "error": "record must be a JSON object"})
+                continue
+            try:
+                self.encode_record(record, out=X[len(row_index)])
+                row_index.append(i)
+            except KeyError as e:
+                errors.append({"index": i, "error": f"missing feature: {e.args[0]}"})
+            except (TypeError, ValueError) as e:
+                errors.append({"index": i, "error": str(e)})
+
+        return X[:len(row_index)], row_index, errors
+
+    def encode_columns(self, columns: dict):
+        """
+        Encode a columnar payload (``{feature: [values, ...]}``) with
+        vectorized NumPy operations.
+
+        Returns ``(X, row_index, errors)`` like ``encode_records``.
+        """
+        required = self.numeric_columns + self.categorical_columns
+        missing = [col for col in required if col not in columns]
+        if missing:
+            raise ValueError(f"missing feature columns: {missing}")
+
+        lengths = {len(columns[col]) for col in required}
+        if len(lengths) > 1:
+            raise ValueError("all feature columns must have the same length")
+
+        n_rows = lengths.pop() if lengths else 0
+        X = np.zeros((n_rows, self.n_features), dtype=np.float64)
+        bad_rows = {}
+
+        for i, col in self._numeric_index:
+            values = columns[col]
+            try:
+                # JSON booleans would silently convert to 0/1
+                if any(isinstance(v, bool) for v in values):
+                    raise TypeError
+                X[:, i] = np.asarray(
+                    [np.nan if v is None else v for v in values],
+                    dtype=np.float64
+                )
+            except (TypeError, ValueError):
+                for r, value in enumerate(values):
+                    try:
+                        if isinstance(value, bool):
+                            raise TypeError
+                        X[r, i] = np.nan if value is None else float(value)
+                    except (TypeError, ValueError):
+                        X[r, i] = np.nan
+                        bad_rows.setdefault(
+                            r, f"invalid value for feature {col}: {value!r}"
+                        )
+            nan_mask = np.isnan(X[:, i])
+            X[nan_mask, i] = self.fill_values[i]
+
+        rows = np.arange(n_rows)
+        for col, lookup in self._category_index:
+            values = columns[col]
+            is_string = np.fromiter(
+                (isinstance(v, str) for v in values), dtype=bool, count=n_rows
+            )
+            for r in np.flatnonzero(~is_string).tolist():
+                if values[r] is not None:
+                    bad_rows.setdefault(
+                        r, f"invalid value for feature {col}: {values[r]!r}"
+                    )
+            if not lookup:
+                continue
+
+            # Categories are sorted at fit time, so a binary search finds them
+            strings = np.array(
+                [v if ok else "" for v, ok in zip(values, is_string)], dtype=str
+            )
+            categories = np.asarray(self.categories[col], dtype=str)
+            codes = np.searchsorted(categories, strings)
+            codes[codes == len(categories)] = 0
+            known = is_string & (categories[codes] == strings)
+            X[rows[known], min(lookup.values()) + codes[known]] = 1.0
+
+        if not bad_rows:
+            return X, list(range(n_rows)), []
+
+        keep = np.ones(n_rows, dtype=bool)
+        keep[list(bad_rows)] = False
+        errors = [
+            {"index": r, "error": message}
+            for r, message in sorted(bad_rows.items())
+        ]
+        return X[keep], np.flatnonzero(keep).tolist(), errors
+
+    def transform(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Encode a DataFrame (training/evaluation path) into the fixed layout.
+        """
+        n_numeric = len(self.numeric_columns)
+        X = np.zeros((len(df), self.n_features), dtype=np.float64)
+
+        numeric = df[self.numeric_columns].to_numpy(dtype=np.float64)
+        nan_mask = np.isnan(numeric)
+        if nan_mask.any():
+            numeric = np.where(nan_mask, self.fill_values, numeric)
+        X[:, :n_numeric] = numeric
+
+        rows = np.arange(len(df))
+        for col, lookup in self._category_index:
+            codes = pd.Categorical(
+                df[col].astype(str), categories=self.categories[col]
+            ).codes
+            known = codes >= 0
+            offset = min(lookup.values()) if lookup else 0
+            X[rows[known], offset + codes[known]] = 1.0
+
+        return X
+
+    # -------------------- Persistence --------------------
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path: str) -> "FeatureEncoder":
+        with open(path, "rb") as f:
+            return pickle.load(f)
@@ -0,0 +1,171 @@
+import joblib
+import numpy as np
+
+
+class FlatTreeEnsemble:
+    """
+    Tree ensemble flattened into a handful of contiguous node arrays.
+
+    All trees share one set of arrays (``roots`` holds each tree's first
+    node), so the artifact is a few large buffers instead of hundreds of
+    pickled ``Tree`` objects. Saved with uncompressed joblib, the arrays can
+    be memory-mapped read-only and shared by every worker on the host.
+
+    Leaves point to themselves, so every tree can be walked for a whole
+    batch at once: ``max_depth`` steps of gather-compare-step over an
+    (n_rows, n_trees) matrix of node indices, with no per-tree Python loop.
+    ``children`` interleaves left/right so a step is a single gather at
+    ``2 * node + went_right``.
+
+    prediction = base + scale * sum(leaf value of each tree)
+    """
+
+    # Bounds the (rows x trees) node matrix of one predict step
+    CHUNK_ELEMENTS = 1 << 18
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        value: np.ndarray,
+        roots: np.ndarray,
+        n_features: int,
+        max_depth: int,
+        base: float = 0.0,
+        scale: float = 1.0,
+        source: str = ""
+    ):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.n_features = n_features
+        self.base = base
+        self.scale = scale
+        self.source = source
+        self.max_depth = max_depth
+        self.children = np.stack([left, right], axis=1).ravel()
+
+    @property
+    def n_features_in_(self) -> int:
+        # sklearn's name, so callers can validate input width either way
+        return self.n_features
+
+    # -------------------- Export --------------------
+    @classmethod
+    def from_model(cls, model) -> "FlatTreeEnsemble":
+        """
+        Flatten a fitted sklearn tree regressor. Raises TypeError for
+        models without tree structure (e.g. LinearRegression).
+        """
+        # Imported here, not at module level: unpickling a serving artifact
+        # imports this module, and serving must not pay for sklearn
+        from sklearn.ensemble import (
+            RandomForestRegressor,
+            ExtraTreesRegressor,
+            GradientBoostingRegressor
+        )
+        from sklearn.tree import DecisionTreeRegressor
+
+        if isinstance(model, (RandomForestRegressor, ExtraTreesRegressor)):
+            trees = [est.tree_ for est in model.estimators_]
+            base, scale = 0.0, 1.0 / len(trees)
+        elif isinstance(model, GradientBoostingRegressor):
+            trees = [est.tree_ for est in model.estimators_[:, 0]]
+            scale = float(model.learning_rate)
+            if model.init_ == "zero":
+                base = 0.0
+            else:
+                dummy = np.zeros((1, model.n_features_in_))
+                base = float(np.ravel(model.init_.predict(dummy))[0])
+        elif isinstance(model, DecisionTreeRegressor):
+            trees = [model.tree_]
+            base, scale = 0.0, 1.0
+        else:
+            raise TypeError(
+                f"Cannot flatten model of type {type(model).__name__}"
+            )
+
+        if any(tree.n_outputs != 1 for tree in trees):
+            raise TypeError("Only single-output regressors are supported")
+
+        sizes = np.array([tree.node_count for tree in trees])
+        offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+
+        feature, threshold, left, right, value = [], [], [], [], []
+        for tree, offset in zip(trees, offsets):
+            is_leaf = tree.children_left < 0
+            own_index = np.arange(tree.node_count) + offset
+            feature.append(np.where(is_leaf, 0, tree.feature))
+            threshold.append(tree.threshold)
+            left.append(np.where(is_leaf, own_index, tree.children_left + offset))
+            right.append(np.where(is_leaf, own_index, tree.children_right + offset))
+            value.append(tree.value[:, 0, 0])
+
+        return cls(
+            feature=np.concatenate(feature).astype(np.int32),
+            threshold=np.concatenate(threshold).astype(np.float64),
+            left=np.concatenate(left).astype(np.int32),
+            right=np.concatenate(right).astype(np.int32),
+            value=np.concatenate(value).astype(np.float64),
+            roots=offsets.astype(np.int32),
+            n_features=int(model.n_features_in_),
+            base=base,
+            scale=scale,
+            source=type(model).__name__,
+            max_depth=int(max(tree.max_depth for tree in trees))
+        )
+
+    def verify(self, model, X, rtol: float = 1e-7, atol: float = 1e-6) -> float:
+        """
+        Check predictions against the sklearn model on sample rows ``X``.
+        Returns the largest absolute difference; raises ValueError when it
+        is outside tolerance.
+        """
+        expected = model.predict(X)
+        actual = self.predict(X)
+        max_diff = float(np.max(np.abs(expected - actual))) if len(X) else 0.0
+
+        if not np.allclose(actual, expected, rtol=rtol, atol=atol):
+            raise ValueError(
+                f"Flattened {self.source} deviates from sklearn "
+                f"(max abs diff {max_diff})"
+            )
+        return max_diff
+
+    # -------------------- Inference --------------------
+    def predict(self, X) -> np.ndarray:
+        # sklearn compares float32 features against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        n_rows = X.shape[0]
+        n_trees = len(self.roots)
+        chunk_rows = max(1, self.CHUNK_ELEMENTS // n_trees)
+        total = np.empty(n_rows, dtype=np.float64)
+
+        for start in range(0, n_rows, chunk_rows):
+            chunk = np.ascontiguousarray(X[start:start + chunk_rows])
+            flat = chunk.ravel()
+            row_offset = (
+                np.arange(chunk.shape[0], dtype=np.intp) * chunk.shape[1]
+            )[:, None]
+
+            node = np.tile(self.roots.astype(np.intp), (chunk.shape[0], 1))
+            for _ in range(self.max_depth):
+                go_right = flat[row_offset + self.feature[node]] > self.threshold[node]
+                node = self.children[2 * node + go_right]
+
+            total[start:start + chunk.shape[0]] = self.value[node].sum(axis=1)
+
+        return self.base + self.scale * total
+
+    # -------------------- Persistence --------------------
+    def save(self, path: str) -> None:
+        joblib.dump(self, path, compress=0)
+
+    @staticmethod
+    def load(path: str, mmap_mode: str = "r"):
+        return joblib.load(path, mmap_mode=mmap_mode)
@@ -0,0 +1,201 @@
+import os
+import hashlib
+
+import numpy as np
+from scipy.stats import randint, uniform, loguniform
+
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import (
+    HalvingRandomSearchCV,
+    KFold,
+    cross_val_score
+)
+
+from src.logger.logger import logger
+
+
+class HyperparameterSearch:
+    """
+    Successive-halving random search with k-fold CV over per-candidate
+    parameter ranges.
+
+    Each round scores many configurations on a small share of the data and
+    only the best ``1/factor`` move on to a larger share, so weak
+    configurations are dropped before paying for a full-size fit. Fold
+    splits are computed once and cached on disk so every candidate (and
+    repeated runs on the same data) is scored on identical folds.
+
+    Ranges in config are interpreted as:
+      [int, int]      -> uniform integers, bounds inclusive
+      [float, float]  -> log-uniform if the bounds span >= 10x, else uniform
+      other lists     -> discrete choices
+      scalar          -> fixed value
+    """
+
+    def __init__(self, search_cfg: dict, model_registry: dict):
+        self.search_cfg = search_cfg
+        self.model_registry = model_registry
+
+        self.cv_folds = search_cfg.get("cv_folds", 5)
+        self.random_state = search_cfg.get("random_state", 42)
+        self.fold_cache_dir = search_cfg.get("fold_cache_dir")
+
+        logger.info(
+            f"HyperparameterSearch initialized with {self.cv_folds}-fold CV, "
+            f"factor={search_cfg.get('factor', 3)}"
+        )
+
+    # -------------------- Ranges --------------------
+    @staticmethod
+    def _distribution(values):
+        if not isinstance(values, list):
+            return [values]
+
+        if len(values) == 2 and all(
+            isinstance(v, int) and not isinstance(v, bool) for v in values
+        ):
+            return randint(values[0], values[1] + 1)
+
+        if len(values) == 2 and all(isinstance(v, float) for v in values):
+            low, high = values
+            if low > 0 and high / low >= 10:
+                return loguniform(low, high)
+            return uniform(low, high - low)
+
+        return values
+
+    # -------------------- Folds --------------------
+    def _folds(self, y: np.ndarray) -> list:
+        """
+        K-fold index splits, cached on disk keyed by the data and settings.
+        """
+        key = hashlib.sha256(
+            np.ascontiguousarray(y).tobytes()
+            + f"{self.cv_folds}:{self.random_state}".encode()
+        ).hexdigest()[:16]
+
+        cache_path = None
+        if self.fold_cache_dir:
+            os.makedirs(self.fold_cache_dir, exist_ok=True)
+            cache_path = os.path.join(self.fold_cache_dir, f"folds_{key}.npz")
+
+            if os.path.exists(cache_path):
+                logger.info(f"Reusing cached CV folds from {cache_path}")
+                cached = np.load(cache_path)
+                return [
+                    (cached[f"train_{i}"], cached[f"test_{i}"])
+                    for i in range(self.cv_folds)
+                ]
+
+        splitter = KFold(
+            n_splits=self.cv_folds,
+            shuffle=True,
+            random_state=self.random_state
+        )
+        folds = list(splitter.split(np.zeros((len(y), 1))))
+
+        if cache_path:
+            arrays = {}
+            for i, (train_idx, test_idx) in enumerate(folds):
+                arrays[f"train_{i}"] = train_idx
+                arrays[f"test_{i}"] = test_idx
+            np.savez(cache_path, **arrays)
+            logger.info(f"CV folds cached at {cache_path}")
+
+        return folds
+
+    # -------------------- Search --------------------
+    def run(self, X, y, candidates: dict) -> dict:
+        """
+        Search every candidate that has ``param_ranges``; candidates without
+        ranges are scored with plain CV on the same folds so all CV scores
+        are comparable.
+
+        Returns {model_name: {"params", "cv_score", "survivors"}} where
+        survivors are the configurations that reached the last round.
+        """
+        folds = self._folds(y)
+        param_ranges = self.search_cfg.get("param_ranges", {})
+        n_jobs = self.search_cfg.get("n_jobs", -1)
+        results = {}
+
+        for model_name, base_params in candidates.items():
+            model_class = self.model_registry[model_name]
+            ranges = param_ranges.get(model_name)
+
+            if not ranges:
+                scores = cross_val_score(
+                    model_class(**base_params), X, y,
+                    cv=folds, scoring="r2", n_jobs=n_jobs
+                )
+                results[model_name] = {
+                    "params": dict(base_params),
+                    "cv_score": float(scores.mean()),
+                    "survivors": []
+                }
+                logger.info(
+                    f"{model_name} has no search ranges, "
+                    f"CV R2 score: {scores.mean()}"
+                )
+                continue
+
+            distributions = {
+                name: self._distribution(values)
+                for name, values in ranges.items()
+            }
+            fixed = {
+                k: v for k, v in base_params.items() if k not in distributions
+            }
+
+            logger.info(
+                f"Searching {model_name} over {list(distributions)} "
+                f"with successive halving"
+            )
+
+            search = HalvingRandomSearchCV(
+                estimator=model_class(**fixed),
+                param_distributions=distributions,
+                n_candidates=self.search_cfg.get("n_candidates", "exhaust"),
+                factor=self.search_cfg.get("factor", 3),
+                resource=self.search_cfg.get("resource", "n_samples"),
+                min_resources=self.search_cfg.get("min_resources", "exhaust"),
+                cv=folds,
+                scoring="r2",
+                refit=False,
+                random_state=self.random_state,
+                n_jobs=n_jobs
+            )
+            search.fit(X, y)
+
+            cv_results = search.cv_results_
+            last_iter = cv_results["iter"] == cv_results["iter"].max()
+            survivors = [
+                {
+                    "params": {
+                        k: v.item() if isinstance(v, np.generic) else v
+                        for k, v in cv_results["params"][i].items()
+                    },
+                    "mean_test_score": float(cv_results["mean_test_score"][i]),
+                    "std_test_score": float(cv_results["std_test_score"][i]),
+                    "n_resources": int(cv_results["n_resources"][i])
+                }
+                for i in np.flatnonzero(last_iter)
+            ]
+
+            best_params = {
+                k: v.item() if isinstance(v, np.generic) else v
+                for k, v in search.best_params_.items()
+            }
+            results[model_name] = {
+                "params": {**fixed, **best_params},
+                "cv_score": float(search.best_score_),
+                "survivors": survivors
+            }
+
+            logger.info(
+                f"{model_name} search finished after {search.n_iterations_} "
+                f"rounds ({len(cv_results['params'])} fits per fold); best CV "
+                f"R2 {search.best_score_} with {best_params}"
+            )
+
+        return results
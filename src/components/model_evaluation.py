@@ -2,22 +2,37 @@ import os
 import sys
 import json
 import pickle
-import boto3
-import pandas as pd
-
-from sklearn.metrics import r2_score
 
 from src.logger.logger import logger
 from src.exception.exception import CustomException
+from src.components.evaluation_engine import (
+    ChampionChallengerEvaluator,
+    PairedBootstrap
+)
+from src.components.feature_encoder import FeatureEncoder
+from src.storage.model_cache import ModelCache
+from src.storage.s3 import get_storage
+from src.utils.artifact_context import ArtifactContext
 
 
 class ModelEvaluation:
-    def __init__(self, metrics_cfg: dict, data_cfg: dict, s3_cfg: dict):
+    def __init__(
+        self,
+        metrics_cfg: dict,
+        data_cfg: dict,
+        s3_cfg: dict,
+        context: ArtifactContext = None
+    ):
         self.metrics_cfg = metrics_cfg
         self.data_cfg = data_cfg
         self.s3_cfg = s3_cfg
+        self.context = context or ArtifactContext(keep_in_memory=False)
 
-        self.s3_client = boto3.client("s3")
+        self.model_cache = ModelCache(
+            cache_dir=self.s3_cfg["cache_dir"],
+            max_bytes=self.s3_cfg["cache_max_mb"] * 1024 * 1024,
+            storage=get_storage(self.s3_cfg)
+        )
 
         os.makedirs(self.metrics_cfg["metrics_dir"], exist_ok=True)
         logger.info(
@@ -25,64 +40,125 @@ class ModelEvaluation:
             f"{self.metrics_cfg['metrics_dir']}"
         )
 
-    def evaluate(self, new_model_path: str, test_path: str) -> dict:
+    def _load_champion(self) -> tuple:
+        """
+        Fetch and unpickle the production model and its encoder. Runs on a
+        background thread while the challenger is scored.
+        """
+        logger.info("Fetching existing production model from S3")
+        old_model_path = self.model_cache.fetch(
+            self.s3_cfg["bucket"],
+            self.s3_cfg["model_key"]
+        )
+        with open(old_model_path, "rb") as f:
+            old_model = pickle.load(f)
+
+        old_encoder = None
         try:
-            logger.info("Starting model evaluation step")
+            old_encoder = FeatureEncoder.load(
+                self.model_cache.fetch(
+                    self.s3_cfg["bucket"],
+                    self.s3_cfg["encoder_key"]
+                )
+            )
+        except Exception:
+            logger.warning(
+                "No encoder stored with the production model. "
+                "Scoring it with the new encoder layout."
+            )
 
-            logger.info(f"Loading test data from {test_path}")
-            df = pd.read_csv(test_path)
+        logger.info("Production model loaded")
+        return old_model, old_encoder
 
-            X = pd.get_dummies(
-                df.drop(self.data_cfg["target"], axis=1)
-            )
-            y = df[self.data_cfg["target"]]
+    def evaluate(
+        self, new_model_path: str, test_path: str, encoder_path: str
+    ) -> dict:
+        """
+        Score the new model and the production model on the test set,
+        streamed in chunks so memory does not grow with its size.
+        """
+        try:
+            logger.info("Starting model evaluation step")
+
+            logger.info(f"Loading feature encoder from {encoder_path}")
+            encoder = FeatureEncoder.load(encoder_path)
 
-            # -------------------- New Model Evaluation --------------------
             logger.info(f"Loading new model from {new_model_path}")
             with open(new_model_path, "rb") as f:
                 new_model = pickle.load(f)
 
-            new_predictions = new_model.predict(X)
-            new_score = r2_score(y, new_predictions)
-
-            logger.info(f"New model R2 score: {new_score}")
-
-            # -------------------- Old Model Evaluation --------------------
-            old_score = None
-            old_model_path = "old_model.pkl"
+            # All columns are read: the production encoder may need
+            # features the new one dropped
+            chunks = self.context.iter_chunks(
+                test_path,
+                chunk_size=self.metrics_cfg.get("eval_chunk_size", 100_000)
+            )
 
-            try:
-                logger.info(
-                    "Attempting to download existing production model from S3"
-                )
-                self.s3_client.download_file(
-                    self.s3_cfg["bucket"],
-                    self.s3_cfg["model_key"],
-                    old_model_path
+            n_resamples = self.metrics_cfg.get("bootstrap_resamples", 2000)
+            bootstrap = (
+                PairedBootstrap(
+                    n_resamples=n_resamples,
+                    seed=self.metrics_cfg.get("bootstrap_seed", 42)
                 )
+                if n_resamples > 0 else None
+            )
 
-                with open(old_model_path, "rb") as f:
-                    old_model = pickle.load(f)
-
-                old_predictions = old_model.predict(X)
-                old_score = r2_score(y, old_predictions)
+            evaluator = ChampionChallengerEvaluator(
+                challenger=new_model,
+                encoder=encoder,
+                target=self.data_cfg["target"],
+                max_pending_chunks=self.metrics_cfg.get(
+                    "eval_max_pending_chunks", 4
+                ),
+                bootstrap=bootstrap
+            )
+            new_metrics, old_metrics = evaluator.run(
+                chunks, self._load_champion
+            )
 
-                logger.info(f"Old model R2 score: {old_score}")
+            logger.info(
+                f"New model on {new_metrics['n_rows']} rows: "
+                f"R2={new_metrics['r2']}, MAE={new_metrics['mae']}, "
+                f"RMSE={new_metrics['rmse']}"
+            )
 
-            except Exception:
-                logger.warning(
-                    "No existing production model found in S3. "
-                    "Assuming first deployment."
+            new_score = new_metrics["r2"]
+            old_score = None
+            if old_metrics is not None:
+                old_score = old_metrics["r2"]
+                logger.info(
+                    f"Old model R2={old_score}, MAE={old_metrics['mae']}, "
+                    f"RMSE={old_metrics['rmse']}"
                 )
 
             # -------------------- Promotion Decision --------------------
-            promote = (
-                old_score is None or new_score > old_score
-            )
+            # The R2 gain must clear the margin at the lower end of its
+            # bootstrap confidence interval, not just on the point estimate,
+            # so noise alone does not flip the production model
+            min_gain = self.metrics_cfg.get("promotion_min_r2_gain", 0.0)
+            confidence = self.metrics_cfg.get("promotion_confidence", 0.95)
+            comparison = None
+
+            if old_score is None:
+                promote = True
+            elif bootstrap is not None:
+                comparison = bootstrap.result(confidence)
+                promote = comparison["r2_diff_ci"][0] > min_gain
+                logger.info(
+                    f"R2 gain {new_score - old_score:.5f}, "
+                    f"{confidence:.0%} CI {comparison['r2_diff_ci']}; "
+                    f"RMSE change CI {comparison['rmse_diff_ci']}"
+                )
+            else:
+                promote = new_score - old_score > min_gain
 
             metrics = {
                 "new_model_r2": new_score,
                 "old_model_r2": old_score,
+                "new_model": new_metrics,
+                "old_model": old_metrics,
+                "comparison": comparison,
+                "promotion_min_r2_gain": min_gain,
                 "promote": promote
             }
 
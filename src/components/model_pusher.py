@@ -1,16 +1,16 @@
 import os
 import sys
-import boto3
 
 from src.logger.logger import logger
 from src.exception.exception import CustomException
+from src.storage.s3 import get_storage
 
 
 class ModelPusher:
     def __init__(self, cfg: dict):
         try:
             self.cfg = cfg
-            self.s3_client = boto3.client("s3")
+            self.storage = get_storage(self.cfg)
 
             logger.info(
                 f"ModelPusher initialized with bucket={self.cfg['bucket']}, "
@@ -24,20 +24,31 @@ class ModelPusher:
             )
             raise CustomException(e, sys)
 
-    def push(self, model_path: str) -> None:
+    def push(self, model_path: str, extra_files: dict = None) -> None:
+        """
+        Upload the model, plus any companion artifacts given as
+        {s3_key: local_path} (e.g. the feature encoder).
+        """
         try:
             logger.info(f"Starting model push to S3 from path: {model_path}")
 
-            if not os.path.exists(model_path):
-                raise FileNotFoundError(
-                    f"Model file not found at path: {model_path}"
-                )
+            uploads = dict(extra_files or {})
+            uploads[self.cfg["model_key"]] = model_path
 
-            self.s3_client.upload_file(
-                Filename=model_path,
-                Bucket=self.cfg["bucket"],
-                Key=self.cfg["model_key"]
-            )
+            for key, path in uploads.items():
+                if not os.path.exists(path):
+                    raise FileNotFoundError(
+                        f"Model file not found at path: {path}"
+                    )
+
+            # Companion artifacts first, so the model key never points at a
+            # model whose encoder has not been uploaded yet
+            for key, path in uploads.items():
+                self.storage.upload(path, self.cfg["bucket"], key)
+
+                logger.info(
+                    f"Uploaded {path} to s3://{self.cfg['bucket']}/{key}"
+                )
 
             logger.info(
                 f"Model successfully uploaded to s3://{self.cfg['bucket']}/"
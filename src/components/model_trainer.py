@@ -1,8 +1,14 @@
 import os
 import sys
+import time
 import pickle
-import pandas as pd
+import tempfile
+import joblib
+import numpy as np
 import mlflow
+import sklearn
+
+from concurrent.futures import ProcessPoolExecutor
 
 from sklearn.linear_model import LinearRegression
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
@@ -10,13 +16,60 @@ from sklearn.metrics import r2_score
 
 from src.logger.logger import logger
 from src.exception.exception import CustomException
+from src.components.feature_encoder import FeatureEncoder
+from src.components.flat_ensemble import FlatTreeEnsemble
+from src.components.hyperparameter_search import HyperparameterSearch
+from src.components.reference_profile import ReferenceProfile
+from src.utils.artifact_context import ArtifactContext
+from src.pipeline.stage_cache import StageCache
+
+
+# Training rows used to check the flattened model against sklearn
+PARITY_CHECK_ROWS = 2000
+
+
+def _fit_candidate(model_class, params: dict, X, y):
+    start = time.perf_counter()
+    model = model_class(**params)
+    model.fit(X, y)
+    score = r2_score(y, model.predict(X))
+
+    # n_jobs is a fit-time CPU budget; the pickled model must not carry it
+    # into evaluation and serving, where a thread pool per predict call
+    # makes small batches several times slower
+    if "n_jobs" in params:
+        model.set_params(n_jobs=None)
+    return model, score, time.perf_counter() - start
+
+
+def _fit_candidate_shared(model_class, params: dict, data_dir: str):
+    """
+    Process-pool entry point: the training matrix is memory-mapped from
+    .npy files written once by the parent instead of being pickled into
+    every task.
+    """
+    X = np.load(os.path.join(data_dir, "X.npy"), mmap_mode="r")
+    y = np.load(os.path.join(data_dir, "y.npy"), mmap_mode="r")
+    return _fit_candidate(model_class, params, X, y)
 
 
 class ModelTrainer:
-    def __init__(self, model_cfg: dict, data_cfg: dict, mlflow_cfg: dict):
+    def __init__(
+        self,
+        model_cfg: dict,
+        data_cfg: dict,
+        mlflow_cfg: dict,
+        context: ArtifactContext = None,
+        stage_cache: StageCache = None
+    ):
         self.model_cfg = model_cfg
         self.data_cfg = data_cfg
         self.mlflow_cfg = mlflow_cfg
+        self.context = context or ArtifactContext(keep_in_memory=False)
+        # Reuses fitted candidates whose data, params and code are unchanged
+        self.stage_cache = stage_cache
+        # Fit time per candidate fitted in the last train() call
+        self.fit_seconds = {}
 
         os.makedirs(self.model_cfg["model_dir"], exist_ok=True)
         logger.info("ModelTrainer initialized")
@@ -35,50 +88,112 @@ class ModelTrainer:
             mlflow.set_tracking_uri(self.mlflow_cfg["tracking_uri"])
             mlflow.set_experiment(self.mlflow_cfg["experiment_name"])
 
-            df = pd.read_csv(train_path)
+            df = self.context.read(train_path)
 
-            X = pd.get_dummies(
-                df.drop(self.data_cfg["target"], axis=1)
+            encoder = FeatureEncoder(target=self.data_cfg["target"]).fit(df)
+            X = self.context.features(train_path, encoder, df=df)
+            y = df[self.data_cfg["target"]].to_numpy()
+
+            logger.info(
+                f"Feature encoder fitted with {encoder.n_features} features: "
+                f"{encoder.feature_names}"
             )
-            y = df[self.data_cfg["target"]]
 
-            best_model = None
-            best_score = float("-inf")
-            best_model_name = None
+            candidate_params = dict(self.model_cfg["candidates"])
+            search_results = {}
 
-            for model_name, params in self.model_cfg["candidates"].items():
-                if model_name not in self.model_registry:
-                    raise ValueError(f"Unsupported model: {model_name}")
+            search_cfg = self.model_cfg.get("search", {})
+            if search_cfg.get("enabled", False):
+                search_results = HyperparameterSearch(
+                    search_cfg, self.model_registry
+                ).run(X, y, candidate_params)
 
-                logger.info(
-                    f"Training model: {model_name} with params: {params}"
+                for model_name, result in search_results.items():
+                    candidate_params[model_name] = result["params"]
+                    self._log_search_survivors(model_name, result["survivors"])
+
+            training_cfg = self.model_cfg.get("training", {})
+            candidates = self._resolve_candidates(
+                candidate_params,
+                apply_cpu_budget=training_cfg.get("parallel", False)
+            )
+
+            fingerprints = self._candidate_fingerprints(candidates, train_path)
+            reused = self._load_cached_candidates(fingerprints)
+            to_fit = {
+                name: candidate
+                for name, candidate in candidates.items()
+                if name not in reused
+            }
+
+            fitted = []
+            if to_fit and training_cfg.get("parallel", False):
+                fitted = self._fit_parallel(
+                    to_fit, X, y, training_cfg.get("n_workers")
                 )
+            elif to_fit:
+                fitted = self._fit_sequential(to_fit, X, y)
 
-                model_class = self.model_registry[model_name]
-                model = model_class(**params)
+            if self.stage_cache is not None:
+                for model_name, result in fitted:
+                    self.stage_cache.save_object(
+                        f"candidate:{model_name}",
+                        fingerprints[model_name],
+                        result
+                    )
 
-                with mlflow.start_run(run_name=model_name):
-                    model.fit(X, y)
-                    predictions = model.predict(X)
-                    score = r2_score(y, predictions)
+            fitted = dict(fitted)
+            self.fit_seconds = {
+                name: result[2] for name, result in fitted.items()
+            }
+            results = [
+                (name, reused[name] if name in reused else fitted[name])
+                for name in candidates
+            ]
 
-                    mlflow.log_metric("train_r2", score)
-                    mlflow.log_metric("train_rows", len(X))
+            best_model = None
+            best_score = float("-inf")
+            best_model_name = None
 
-                    for param_key, param_value in params.items():
-                        mlflow.log_param(param_key, param_value)
+            # MLflow runs are always written from this process, in config order
+            for model_name, (model, score, fit_seconds) in results:
+                params = candidate_params[model_name]
 
-                    mlflow.log_param("model_name", model_name)
-                    mlflow.sklearn.log_model(model, "model")
+                # With search enabled, candidates compete on CV score
+                # instead of the optimistic training-set R2
+                selection_score = score
+                if model_name in search_results:
+                    selection_score = search_results[model_name]["cv_score"]
 
+                # Reused candidates were logged to MLflow when first fitted
+                if model_name in reused:
                     logger.info(
-                        f"{model_name} completed with R2 score: {score}"
+                        f"{model_name} reused from stage cache "
+                        f"with R2 score: {score}"
                     )
+                else:
+                    with mlflow.start_run(run_name=model_name):
+                        mlflow.log_metric("train_r2", score)
+                        if model_name in search_results:
+                            mlflow.log_metric("cv_r2", selection_score)
+                        mlflow.log_metric("train_rows", len(X))
+                        mlflow.log_metric("fit_seconds", fit_seconds)
 
-                    if score > best_score:
-                        best_score = score
-                        best_model = model
-                        best_model_name = model_name
+                        for param_key, param_value in params.items():
+                            mlflow.log_param(param_key, param_value)
+
+                        mlflow.log_param("model_name", model_name)
+                        mlflow.sklearn.log_model(model, "model")
+
+                    logger.info(
+                        f"{model_name} completed with R2 score: {score} "
+                        f"in {fit_seconds:.1f}s"
+                    )
+
+                if selection_score > best_score:
+                    best_score = selection_score
+                    best_model = model
+                    best_model_name = model_name
 
             logger.info(
                 f"Best model selected: {best_model_name} "
@@ -93,8 +208,59 @@ class ModelTrainer:
             with open(model_path, "wb") as f:
                 pickle.dump(best_model, f)
 
+            # Serving artifact: tree ensembles are flattened into a few node
+            # arrays that the server memory-maps instead of unpickling, and
+            # only used if they reproduce sklearn's predictions
+            artifact_path = os.path.join(
+                self.model_cfg["model_dir"],
+                self.model_cfg["artifact_name"]
+            )
+            tmp_artifact_path = artifact_path + ".tmp"
+            try:
+                flat_model = FlatTreeEnsemble.from_model(best_model)
+                max_diff = flat_model.verify(best_model, X[:PARITY_CHECK_ROWS])
+                flat_model.save(tmp_artifact_path)
+                logger.info(
+                    f"Exported flattened {best_model_name} with "
+                    f"{len(flat_model.roots)} trees "
+                    f"(max abs diff vs sklearn {max_diff:.2e})"
+                )
+            except TypeError:
+                joblib.dump(best_model, tmp_artifact_path, compress=0)
+            except ValueError:
+                logger.warning(
+                    "Flattened model failed the parity check. "
+                    "Serving the sklearn model instead",
+                    exc_info=True
+                )
+                joblib.dump(best_model, tmp_artifact_path, compress=0)
+
+            # Replace instead of overwriting in place: a running server may
+            # still have the previous artifact memory-mapped
+            os.replace(tmp_artifact_path, artifact_path)
+
+            encoder_path = os.path.join(
+                self.model_cfg["model_dir"],
+                self.model_cfg["encoder_name"]
+            )
+            encoder.save(encoder_path)
+
+            # Reference distribution of the raw inputs, for drift monitoring
+            profile_path = os.path.join(
+                self.model_cfg["model_dir"],
+                self.model_cfg["profile_name"]
+            )
+            ReferenceProfile.from_frame(
+                df,
+                numeric_columns=encoder.numeric_columns,
+                categorical_columns=encoder.categorical_columns,
+                n_bins=self.model_cfg.get("profile_bins", 10)
+            ).save(profile_path)
+
             logger.info(
-                f"Best model ({best_model_name}) saved at {model_path}"
+                f"Best model ({best_model_name}) saved at {model_path} "
+                f"and {artifact_path}, feature encoder saved at {encoder_path}, "
+                f"reference profile saved at {profile_path}"
             )
 
             return model_path
@@ -102,3 +268,111 @@ class ModelTrainer:
         except Exception as e:
             logger.error("Failure occurred during model training", exc_info=True)
             raise CustomException(e, sys)
+
+    def _log_search_survivors(self, model_name: str, survivors: list) -> None:
+        """
+        Log only the configurations that reached the final halving round.
+        """
+        for i, trial in enumerate(survivors):
+            with mlflow.start_run(run_name=f"{model_name}-search-{i}"):
+                mlflow.log_param("model_name", model_name)
+                for param_key, param_value in trial["params"].items():
+                    mlflow.log_param(param_key, param_value)
+
+                mlflow.log_metric("cv_r2", trial["mean_test_score"])
+                mlflow.log_metric("cv_r2_std", trial["std_test_score"])
+                mlflow.log_metric("n_resources", trial["n_resources"])
+
+    def _resolve_candidates(
+        self, candidate_params: dict, apply_cpu_budget: bool = False
+    ) -> dict:
+        """
+        Map each candidate to (model_class, fit_params). With
+        ``apply_cpu_budget`` (parallel training) the per-candidate CPU
+        budget is passed as n_jobs where the estimator has it.
+        """
+        cpu_budget = {}
+        if apply_cpu_budget:
+            cpu_budget = self.model_cfg.get("training", {}).get("cpu_budget", {})
+        candidates = {}
+
+        for model_name, params in candidate_params.items():
+            if model_name not in self.model_registry:
+                raise ValueError(f"Unsupported model: {model_name}")
+
+            model_class = self.model_registry[model_name]
+            fit_params = dict(params)
+
+            if model_name in cpu_budget and "n_jobs" in model_class().get_params():
+                fit_params["n_jobs"] = cpu_budget[model_name]
+
+            candidates[model_name] = (model_class, fit_params)
+
+        return candidates
+
+    def _candidate_fingerprints(self, candidates: dict, train_path: str) -> dict:
+        if self.stage_cache is None:
+            return {}
+
+        fingerprints = {}
+        for model_name, (model_class, params) in candidates.items():
+            fingerprints[model_name] = self.stage_cache.fingerprint(
+                inputs=[train_path],
+                config={
+                    "model_name": model_name,
+                    "params": params,
+                    "target": self.data_cfg["target"],
+                    "sklearn": sklearn.__version__
+                },
+                sources=[_fit_candidate, FeatureEncoder, model_class]
+            )
+        return fingerprints
+
+    def _load_cached_candidates(self, fingerprints: dict) -> dict:
+        reused = {}
+        for model_name, fingerprint in fingerprints.items():
+            result = self.stage_cache.load_object(
+                f"candidate:{model_name}", fingerprint
+            )
+            if result is not None:
+                model = result[0]
+                # Cached before n_jobs was reset after fitting
+                if model.get_params().get("n_jobs") is not None:
+                    model.set_params(n_jobs=None)
+                reused[model_name] = result
+        return reused
+
+    def _fit_sequential(self, candidates: dict, X, y) -> list:
+        results = []
+        for model_name, (model_class, params) in candidates.items():
+            logger.info(f"Training model: {model_name} with params: {params}")
+            results.append(
+                (model_name, _fit_candidate(model_class, params, X, y))
+            )
+        return results
+
+    def _fit_parallel(self, candidates: dict, X, y, n_workers=None) -> list:
+        n_workers = n_workers or len(candidates)
+        logger.info(
+            f"Training {len(candidates)} candidates in parallel "
+            f"with {n_workers} worker processes"
+        )
+
+        with tempfile.TemporaryDirectory() as data_dir:
+            np.save(os.path.join(data_dir, "X.npy"), X)
+            np.save(os.path.join(data_dir, "y.npy"), y)
+
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                futures = {}
+                for model_name, (model_class, params) in candidates.items():
+                    logger.info(
+                        f"Submitting model: {model_name} with params: {params}"
+                    )
+                    futures[model_name] = pool.submit(
+                        _fit_candidate_shared, model_class, params, data_dir
+                    )
+
+                return [
+                    (model_name, future.result())
+                    for model_name, future in futures.items()
+                ]
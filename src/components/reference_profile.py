@@ -0,0 +1,172 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+
+# Proportions are floored at this value so empty bins keep PSI finite
+PSI_EPSILON = 1e-4
+
+QUANTILES = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
+
+# Stands in for unhashable categorical values when binning
+_OTHER = object()
+
+
+class ReferenceProfile:
+    """
+    Compact summary of the training inputs that drift is measured against.
+
+    Every feature is reduced to a fixed set of bins with their training
+    proportions: quantile bins for numeric columns, one bin per category
+    plus an "other" bin for categorical columns, and a trailing bin for
+    missing values in both cases. Anything that can produce bin counts
+    (a DataFrame, a request stream) can then be scored with ``score``.
+    """
+
+    def __init__(self):
+        self.n_rows = 0
+        self.features = {}
+
+    # -------------------- Building --------------------
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        numeric_columns: list,
+        categorical_columns: list,
+        n_bins: int = 10
+    ) -> "ReferenceProfile":
+        profile = cls()
+        profile.n_rows = len(df)
+
+        for col in numeric_columns:
+            values = df[col].to_numpy(dtype=np.float64)
+            present = values[~np.isnan(values)]
+
+            # Interior cut points at training quantiles; ties collapse bins
+            edges = []
+            quantiles = {}
+            if len(present):
+                cuts = np.quantile(present, np.linspace(0, 1, n_bins + 1)[1:-1])
+                edges = np.unique(cuts).tolist()
+                quantiles = {
+                    str(q): float(v)
+                    for q, v in zip(QUANTILES, np.quantile(present, QUANTILES))
+                }
+
+            profile.features[col] = {"type": "numeric", "edges": edges}
+            counts = profile.bin_counts(col, values)
+            profile.features[col].update(
+                proportions=(counts / max(len(values), 1)).tolist(),
+                quantiles=quantiles
+            )
+
+        for col in categorical_columns:
+            categories = sorted(df[col].dropna().astype(str).unique().tolist())
+
+            profile.features[col] = {"type": "categorical", "categories": categories}
+            counts = profile.bin_counts(col, df[col].to_numpy(dtype=object))
+            profile.features[col]["proportions"] = (
+                counts / max(len(df), 1)
+            ).tolist()
+
+        return profile
+
+    # -------------------- Binning --------------------
+    def n_bins(self, feature: str) -> int:
+        spec = self.features[feature]
+        if spec["type"] == "numeric":
+            return len(spec["edges"]) + 2  # value bins + missing
+        return len(spec["categories"]) + 2  # categories + other + missing
+
+    def bin_counts(self, feature: str, values) -> np.ndarray:
+        """
+        Vectorized bin counts of ``values`` for ``feature``.
+        """
+        spec = self.features[feature]
+        n_bins = self.n_bins(feature)
+
+        if spec["type"] == "numeric":
+            values = pd.to_numeric(
+                pd.Series(values, copy=False), errors="coerce"
+            ).to_numpy(dtype=np.float64)
+            index = np.searchsorted(spec["edges"], values, side="right")
+            index[np.isnan(values)] = n_bins - 1
+        else:
+            # A Series keeps list values as elements (np.asarray would
+            # build a 2-D array from equal-length lists)
+            try:
+                codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+            except TypeError:
+                # Unhashable values (JSON lists/objects) count as "other"
+                codes, uniques = pd.factorize(pd.Series(
+                    [_OTHER if isinstance(v, (list, dict)) else v for v in values],
+                    dtype=object
+                ))
+
+            # Only the distinct values are looked up. Categories are
+            # strings, so numbers and other non-strings land in "other"
+            lookup = {c: i for i, c in enumerate(spec["categories"])}
+            unique_bins = np.array(
+                [lookup.get(u, n_bins - 2) for u in uniques] + [n_bins - 1],
+                dtype=np.int64
+            )
+            # NaN/None factorize to -1, which picks the trailing missing bin
+            index = unique_bins[codes]
+
+        return np.bincount(index, minlength=n_bins)
+
+    # -------------------- Scoring --------------------
+    def score(self, feature: str, counts: np.ndarray) -> dict:
+        """
+        Drift of observed bin ``counts`` against the reference: PSI over
+        all bins and, for numeric features, the KS statistic of the binned
+        distributions (missing values excluded).
+        """
+        spec = self.features[feature]
+        counts = np.asarray(counts, dtype=np.float64)
+        total = counts.sum()
+        if total == 0:
+            return {"psi": None, "ks": None, "missing_rate": None}
+
+        expected = np.asarray(spec["proportions"], dtype=np.float64)
+        actual = counts / total
+
+        e = np.maximum(expected, PSI_EPSILON)
+        a = np.maximum(actual, PSI_EPSILON)
+        result = {
+            "psi": float(np.sum((a - e) * np.log(a / e))),
+            "ks": None,
+            "missing_rate": float(actual[-1])
+        }
+
+        if spec["type"] == "numeric":
+            e_present = expected[:-1].sum()
+            a_present = counts[:-1].sum()
+            if e_present > 0 and a_present > 0:
+                e_cdf = np.cumsum(expected[:-1]) / e_present
+                a_cdf = np.cumsum(counts[:-1]) / a_present
+                result["ks"] = float(np.max(np.abs(e_cdf - a_cdf)))
+
+        return result
+
+    # -------------------- Persistence --------------------
+    def to_dict(self) -> dict:
+        return {"n_rows": self.n_rows, "features": self.features}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ReferenceProfile":
+        profile = cls()
+        profile.n_rows = data["n_rows"]
+        profile.features = data["features"]
+        return profile
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=4)
+
+    @classmethod
+    def load(cls, path: str) -> "ReferenceProfile":
+        with open(path, "r") as f:
+            return cls.from_dict(json.load(f))
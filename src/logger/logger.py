@@ -1,7 +1,18 @@
+import atexit
+import json
 import logging
 import os
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
+import queue
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler
+)
 
 # Create logs directory
 LOG_DIR = "logs"
@@ -14,6 +25,179 @@ LOG_FILE_PATH = os.path.join(LOG_DIR, LOG_FILE)
 # Logger name
 LOGGER_NAME = "mlops_logger"
 
+# "sync" writes on the calling thread; "async" hands records to a
+# background thread through a bounded queue (used by the inference service)
+LOG_MODE = os.environ.get("LOG_MODE", "sync")
+# "text" or "json" (one JSON object per line)
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "text")
+
+# Async mode: queue bound, batch size and max delay before a batch is written
+LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", 10000))
+LOG_BATCH_SIZE = int(os.environ.get("LOG_BATCH_SIZE", 100))
+LOG_FLUSH_INTERVAL_S = float(os.environ.get("LOG_FLUSH_INTERVAL_S", 1.0))
+
+# Fraction of per-request payloads that are logged (see log_payload)
+LOG_PAYLOAD_SAMPLE_RATE = float(os.environ.get("LOG_PAYLOAD_SAMPLE_RATE", 0.01))
+
+
+# -------------------- Formatters --------------------
+class TextFormatter(logging.Formatter):
+    """
+    The classic pipe-separated format; a structured payload passed as
+    ``extra={"payload": ...}`` is appended to the message.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        payload = getattr(record, "payload", None)
+        if payload is not None:
+            line = f"{line} | payload={payload}"
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "file": record.filename,
+            "line": record.lineno,
+            "message": record.getMessage()
+        }
+
+        payload = getattr(record, "payload", None)
+        if payload is not None:
+            entry["payload"] = payload
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+
+        return json.dumps(entry, default=str)
+
+
+# -------------------- Async handlers --------------------
+class _BatchingHandler(MemoryHandler):
+    """
+    Buffers records and hands them to the target in batches: when the
+    buffer is full or on ERROR. Partial batches are flushed on a timer by
+    the _FlushingQueueListener that feeds this handler.
+    """
+
+    def __init__(self, target, capacity: int):
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target)
+
+
+class _FlushingQueueListener(QueueListener):
+    """
+    QueueListener that also flushes its handlers every ``flush_interval``
+    seconds, so a partial batch is written within the interval even when
+    no further records arrive.
+    """
+
+    def __init__(self, queue_, *handlers, flush_interval: float, **kwargs):
+        super().__init__(queue_, *handlers, **kwargs)
+        self.flush_interval = flush_interval
+
+    def _monitor(self) -> None:
+        q = self.queue
+        next_flush = time.monotonic() + self.flush_interval
+
+        while True:
+            try:
+                record = q.get(timeout=max(0.0, next_flush - time.monotonic()))
+            except queue.Empty:
+                pass
+            else:
+                # The stop sentinel is None, hence the else branch
+                if record is self._sentinel:
+                    q.task_done()
+                    break
+                self.handle(record)
+                q.task_done()
+
+            if time.monotonic() >= next_flush:
+                for handler in self.handlers:
+                    handler.flush()
+                next_flush = time.monotonic() + self.flush_interval
+
+
+class _AsyncQueueHandler(QueueHandler):
+    """
+    Non-blocking front end for the real handlers.
+
+    The calling thread only enqueues the record; formatting and I/O happen
+    on a QueueListener thread. When the queue is full, records below
+    WARNING are dropped (and counted) instead of slowing the caller down.
+    The listener is started per process, so the handler survives a fork.
+    """
+
+    WARNING_PUT_TIMEOUT_S = 1.0
+
+    def __init__(self, handlers: list, max_queue_size: int, flush_interval: float):
+        super().__init__(queue.Queue(maxsize=max_queue_size))
+        self.targets = handlers
+        self.flush_interval = flush_interval
+        self.dropped = 0
+
+        self._listener = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_listener(self) -> None:
+        if self._pid == os.getpid():
+            return
+
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            # A queue inherited across fork has no consumer; start fresh
+            self.queue = queue.Queue(maxsize=self.queue.maxsize)
+            self._listener = _FlushingQueueListener(
+                self.queue, *self.targets,
+                flush_interval=self.flush_interval,
+                respect_handler_level=True
+            )
+            self._listener.start()
+            self._pid = os.getpid()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Records stay in this process, so only what cannot wait is done
+        # here: the message is frozen and tracebacks are rendered while
+        # the frames still exist
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(
+                record.exc_info
+            )
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self._ensure_listener()
+        try:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=self.WARNING_PUT_TIMEOUT_S)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def stats(self) -> dict:
+        return {"queue_depth": self.queue.qsize(), "dropped": self.dropped}
+
+    def stop(self) -> None:
+        if self._listener is not None and self._pid == os.getpid():
+            self._listener.stop()
+            self._listener = None
+            self._pid = None
+        for handler in self.targets:
+            handler.flush()
+
+
 def get_logger():
     logger = logging.getLogger(LOGGER_NAME)
     logger.setLevel(logging.INFO)
@@ -23,9 +207,12 @@ def get_logger():
         return logger
 
     # Log format
-    formatter = logging.Formatter(
-        "%(asctime)s | %(levelname)s | %(filename)s:%(lineno)d | %(message)s"
-    )
+    if LOG_FORMAT == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = TextFormatter(
+            "%(asctime)s | %(levelname)s | %(filename)s:%(lineno)d | %(message)s"
+        )
 
     # File handler (rotates at 5MB, keeps 5 backups)
     file_handler = RotatingFileHandler(
@@ -39,11 +226,46 @@ def get_logger():
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    if LOG_MODE == "async":
+        async_handler = _AsyncQueueHandler(
+            handlers=[
+                _BatchingHandler(handler, LOG_BATCH_SIZE)
+                for handler in (file_handler, console_handler)
+            ],
+            max_queue_size=LOG_QUEUE_SIZE,
+            flush_interval=LOG_FLUSH_INTERVAL_S
+        )
+        logger.addHandler(async_handler)
+        # Drain the queue and write pending batches on shutdown
+        atexit.register(async_handler.stop)
+    else:
+        logger.addHandler(file_handler)
+        logger.addHandler(console_handler)
 
     return logger
 
 
+def log_payload(message: str, payload, sample_rate: float = None) -> bool:
+    """
+    Log a per-request payload for a sample of calls only. The payload is
+    attached as structured data and serialized by the handler (on the
+    background thread in async mode), not by the caller.
+    """
+    if sample_rate is None:
+        sample_rate = LOG_PAYLOAD_SAMPLE_RATE
+    if sample_rate <= 0 or random.random() >= sample_rate:
+        return False
+
+    logger.info(message, extra={"payload": payload}, stacklevel=2)
+    return True
+
+
+def logging_stats() -> dict:
+    for handler in logger.handlers:
+        if isinstance(handler, _AsyncQueueHandler):
+            return {"mode": "async", **handler.stats()}
+    return {"mode": "sync"}
+
+
 # Global logger instance
 logger = get_logger()
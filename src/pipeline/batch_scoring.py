@@ -0,0 +1,198 @@
+import os
+import sys
+import time
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import yaml
+
+from src.logger.logger import logger
+from src.exception.exception import CustomException
+from src.components.feature_encoder import FeatureEncoder
+from src.storage.model_cache import ModelCache
+from src.storage.s3 import get_storage
+from src.utils.frame_io import FrameWriter, iter_frame
+
+
+PREDICTION_COLUMN = "prediction"
+
+# Per-process model state, set by _init_worker
+_model = None
+_encoder = None
+
+
+# -------------------- Worker --------------------
+def _init_worker(model_path: str, encoder_path: str, n_jobs: int = None) -> None:
+    # The pickled sklearn model is used rather than the flattened serving
+    # artifact: sklearn's compiled predict is faster on large chunks
+    global _model, _encoder
+    with open(model_path, "rb") as f:
+        _model = pickle.load(f)
+    if n_jobs is not None and hasattr(_model, "n_jobs"):
+        _model.n_jobs = n_jobs
+    _encoder = FeatureEncoder.load(encoder_path)
+
+
+def _score_chunk(chunk) -> np.ndarray:
+    return _model.predict(_encoder.transform(chunk))
+
+
+# -------------------- Model Resolution --------------------
+def resolve_model_paths(cfg: dict, model_dir: str = None) -> dict:
+    """
+    Local paths of the promoted (production) model and its encoder,
+    fetched from S3 through the model cache.
+
+    ``model_dir`` overrides this with a local directory, e.g. the training
+    output, which holds the latest *trained* model whether or not it was
+    promoted.
+    """
+    model_cfg = cfg["model"]
+
+    if model_dir is not None:
+        logger.warning(
+            f"Scoring with the local model in {model_dir} instead of the "
+            f"promoted model in S3"
+        )
+        return {
+            "model_path": os.path.join(model_dir, model_cfg["model_name"]),
+            "encoder_path": os.path.join(model_dir, model_cfg["encoder_name"])
+        }
+
+    s3_cfg = cfg["s3"]
+    model_cache = ModelCache(
+        cache_dir=s3_cfg["cache_dir"],
+        max_bytes=s3_cfg["cache_max_mb"] * 1024 * 1024,
+        storage=get_storage(s3_cfg)
+    )
+    return {
+        "model_path": model_cache.fetch(s3_cfg["bucket"], s3_cfg["model_key"]),
+        "encoder_path": model_cache.fetch(s3_cfg["bucket"], s3_cfg["encoder_key"])
+    }
+
+
+# -------------------- Batch Scoring --------------------
+def run_batch_scoring(
+    input_path: str,
+    output_path: str,
+    model_paths: dict,
+    chunk_size: int = 100_000,
+    n_workers: int = 0,
+    keep_columns: list = None
+) -> dict:
+    """
+    Score a CSV/Parquet/Arrow file with the promoted model.
+
+    The input is streamed in chunks and predictions are appended to the
+    output as soon as each chunk is scored, in input order. With
+    ``n_workers`` > 1 chunks are scored by a process pool whose workers
+    load the model once; at most two chunks per worker are in flight, so
+    memory is bounded by the chunk size, not the input size. ``n_workers``
+    of 0 uses every core.
+
+    The output holds ``keep_columns`` of the input (all columns by
+    default) followed by the prediction.
+    """
+    try:
+        n_workers = n_workers or os.cpu_count() or 1
+        logger.info(
+            f"Batch scoring {input_path} -> {output_path} in chunks of "
+            f"{chunk_size} rows with {n_workers} worker(s)"
+        )
+
+        start = time.perf_counter()
+        n_rows = 0
+        n_chunks = 0
+
+        def write(writer, chunk, predictions):
+            out = chunk if keep_columns is None else chunk[keep_columns]
+            out = out.assign(**{PREDICTION_COLUMN: predictions})
+            writer.write(out)
+
+        # Pool workers predict single-threaded; the pool is the parallelism
+        initargs = (
+            model_paths["model_path"],
+            model_paths["encoder_path"],
+            1 if n_workers > 1 else None
+        )
+        chunks = iter_frame(input_path, chunk_size)
+
+        with FrameWriter(output_path) as writer:
+            if n_workers == 1:
+                _init_worker(*initargs)
+                for chunk in chunks:
+                    write(writer, chunk, _score_chunk(chunk))
+                    n_rows += len(chunk)
+                    n_chunks += 1
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=n_workers,
+                    initializer=_init_worker,
+                    initargs=initargs
+                ) as pool:
+                    in_flight = deque()
+                    for chunk in chunks:
+                        in_flight.append((chunk, pool.submit(_score_chunk, chunk)))
+                        if len(in_flight) >= 2 * n_workers:
+                            done, future = in_flight.popleft()
+                            write(writer, done, future.result())
+                            n_rows += len(done)
+                            n_chunks += 1
+
+                    while in_flight:
+                        done, future = in_flight.popleft()
+                        write(writer, done, future.result())
+                        n_rows += len(done)
+                        n_chunks += 1
+
+        elapsed = time.perf_counter() - start
+        summary = {
+            "input_path": input_path,
+            "output_path": output_path,
+            "rows": n_rows,
+            "chunks": n_chunks,
+            "workers": n_workers,
+            "seconds": elapsed,
+            "rows_per_second": n_rows / elapsed if elapsed > 0 else None
+        }
+
+        logger.info(
+            f"Batch scoring completed: {n_rows} rows in {elapsed:.2f}s "
+            f"({summary['rows_per_second']:.0f} rows/s)"
+        )
+        return summary
+
+    except Exception as e:
+        logger.error("Batch scoring failed", exc_info=True)
+        raise CustomException(e, sys)
+
+
+def score_file(
+    input_path: str,
+    output_path: str,
+    model_dir: str = None,
+    chunk_size: int = None,
+    n_workers: int = None,
+    keep_columns: list = None,
+    config_path: str = "config/config.yaml"
+) -> dict:
+    """
+    Config-driven entry point used by score.py.
+    """
+    with open(config_path, "r") as f:
+        cfg = yaml.safe_load(f)
+    scoring_cfg = cfg.get("scoring", {})
+
+    return run_batch_scoring(
+        input_path=input_path,
+        output_path=output_path,
+        model_paths=resolve_model_paths(cfg, model_dir),
+        chunk_size=chunk_size or scoring_cfg.get("chunk_size", 100_000),
+        n_workers=(
+            n_workers if n_workers is not None
+            else scoring_cfg.get("n_workers", 0)
+        ),
+        keep_columns=keep_columns
+    )
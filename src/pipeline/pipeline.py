@@ -1,16 +1,26 @@
+import os
 import sys
+import time
 import yaml
 
 from src.logger.logger import logger
 from src.exception.exception import CustomException
+from src.utils.artifact_context import ArtifactContext
+from src.utils.metrics import StageTimer
+from src.pipeline.stage_cache import StageCache
 
 from src.components.data_ingestion import DataIngestion
 from src.components.data_validation import DataValidation
 from src.components.data_transformation import DataTransformation
 from src.components.drift_report import DriftReport
+from src.components.drift_engine import DriftEngine
 from src.components.model_trainer import ModelTrainer
 from src.components.model_evaluation import ModelEvaluation
 from src.components.model_pusher import ModelPusher
+from src.components.feature_encoder import FeatureEncoder
+from src.components.flat_ensemble import FlatTreeEnsemble
+from src.components.hyperparameter_search import HyperparameterSearch
+from src.components.reference_profile import ReferenceProfile
 
 
 def run_pipeline() -> None:
@@ -24,51 +34,210 @@ def run_pipeline() -> None:
         with open("config/config.yaml", "r") as f:
             cfg = yaml.safe_load(f)
 
+        # Keeps DataFrames in memory between stages; files are still
+        # written because they are DVC outputs
+        pipeline_cfg = cfg.get("pipeline", {})
+        context = ArtifactContext(
+            keep_in_memory=pipeline_cfg.get("keep_in_memory", True),
+            free_after_last_use=pipeline_cfg.get("free_after_last_use", True)
+        )
+
+        # Skips stages whose inputs, config and code are unchanged
+        cache_cfg = pipeline_cfg.get("stage_cache", {})
+        stage_cache = StageCache(
+            cache_dir=cache_cfg.get("cache_dir", ".stage_cache"),
+            enabled=cache_cfg.get("enabled", True)
+        )
+        target = cfg["data"]["target"]
+
+        # Wall-clock time per stage and per candidate fit
+        timer = StageTimer(enabled=cfg["metrics"].get("timings_enabled", True))
+        pipeline_start = time.perf_counter()
+
         # -------------------- Data Ingestion --------------------
+        # Always runs: the source can change behind an unchanged URL
         logger.info("Stage: Data Ingestion")
-        raw_data_path = DataIngestion(cfg["data"]).ingest()
+        ingestion = DataIngestion(cfg["data"], context)
+        with timer.stage("ingestion"):
+            raw_data_path = ingestion.ingest()
+
+        validation = DataValidation(cfg["data"], context)
+        validation_fp = stage_cache.fingerprint(
+            inputs=[raw_data_path],
+            config={"target": target},
+            sources=[DataValidation]
+        )
+        run_validation = (
+            stage_cache.lookup("validation", validation_fp) is None
+        )
+
+        transformation = DataTransformation(cfg["data"], context)
+        transformation_fp = stage_cache.fingerprint(
+            inputs=[raw_data_path],
+            config={
+                key: cfg["data"].get(key)
+                for key in ("test_size", "processed_dir", "artifact_format")
+            },
+            sources=[DataTransformation]
+        )
+        split_outputs = stage_cache.lookup("transformation", transformation_fp)
+
+        # Read by validation and transformation, unless skipped; streaming
+        # ingestion has already computed the validation statistics
+        raw_reads = (
+            int(run_validation and ingestion.stats is None)
+            + int(split_outputs is None)
+        )
+        if raw_reads:
+            context.expect(raw_data_path, reads=raw_reads)
+        else:
+            context.release(raw_data_path)
 
         # -------------------- Data Validation -------------------
         logger.info("Stage: Data Validation")
-        DataValidation(cfg["data"]).validate(raw_data_path)
+        if run_validation:
+            with timer.stage("validation"):
+                validation.validate(raw_data_path, stats=ingestion.stats)
+            stage_cache.record(
+                "validation", validation_fp, [validation.report_path]
+            )
+        else:
+            logger.info("Raw data unchanged. Skipping data validation")
 
         # -------------------- Data Transformation ---------------
         logger.info("Stage: Data Transformation")
-        train_path, test_path = DataTransformation(cfg["data"]).split(raw_data_path)
+        if split_outputs is None:
+            with timer.stage("transformation"):
+                train_path, test_path = transformation.split(raw_data_path)
+            stage_cache.record(
+                "transformation", transformation_fp, [train_path, test_path]
+            )
+        else:
+            train_path, test_path = split_outputs
+            logger.info("Raw data unchanged. Reusing train-test split")
 
-        # -------------------- Model Training --------------------
-        logger.info("Stage: Model Training")
-        model_path = ModelTrainer(
+        encoder_path = os.path.join(
+            cfg["model"]["model_dir"],
+            cfg["model"]["encoder_name"]
+        )
+        artifact_path = os.path.join(
+            cfg["model"]["model_dir"],
+            cfg["model"]["artifact_name"]
+        )
+        profile_path = os.path.join(
+            cfg["model"]["model_dir"],
+            cfg["model"]["profile_name"]
+        )
+
+        trainer = ModelTrainer(
             model_cfg=cfg["model"],
             data_cfg=cfg["data"],
-            mlflow_cfg=cfg["mlflow"]
-        ).train(train_path)
-
-        # -------------------- Evidently Drift Report -------------
-        logger.info("Stage: Data Drift Analysis (Evidently)")
-        DriftReport(cfg["metrics"]).generate(
-            train_path=train_path,
-            test_path=test_path
+            mlflow_cfg=cfg["mlflow"],
+            context=context,
+            stage_cache=stage_cache
+        )
+        training_fp = stage_cache.fingerprint(
+            inputs=[train_path],
+            config={"model": cfg["model"], "target": target},
+            sources=[
+                ModelTrainer,
+                FeatureEncoder,
+                FlatTreeEnsemble,
+                HyperparameterSearch,
+                ReferenceProfile
+            ]
+        )
+        training_outputs = stage_cache.lookup("training", training_fp)
+
+        drift = DriftReport(cfg["metrics"], context)
+        # The profile is derived from the training data, so the inputs,
+        # bin count and code cover it before training has rewritten it
+        drift_fp = stage_cache.fingerprint(
+            inputs=[train_path, test_path],
+            config={
+                "metrics": cfg["metrics"],
+                "profile_bins": cfg["model"].get("profile_bins", 10)
+            },
+            sources=[DriftReport, DriftEngine, ReferenceProfile]
         )
+        run_drift = stage_cache.lookup("drift", drift_fp) is None
+
+        # train: training and the HTML drift report; test: drift and
+        # evaluation
+        train_reads = (
+            int(training_outputs is None) + int(run_drift and drift.html)
+        )
+        if train_reads:
+            context.expect(train_path, reads=train_reads)
+        else:
+            context.release(train_path)
+        context.expect(test_path, reads=int(run_drift) + 1)
+
+        # -------------------- Model Training --------------------
+        logger.info("Stage: Model Training")
+        if training_outputs is None:
+            with timer.stage("training"):
+                model_path = trainer.train(train_path)
+            for model_name, seconds in trainer.fit_seconds.items():
+                timer.record(f"fit_{model_name}", seconds)
+            stage_cache.record(
+                "training", training_fp,
+                [model_path, artifact_path, encoder_path, profile_path]
+            )
+        else:
+            model_path = training_outputs[0]
+            logger.info("Training data and config unchanged. Reusing model")
+
+        # -------------------- Data Drift Report -----------------
+        logger.info("Stage: Data Drift Analysis")
+        if run_drift:
+            with timer.stage("drift"):
+                drift.generate(
+                    train_path=train_path,
+                    test_path=test_path,
+                    profile_path=profile_path
+                )
+            stage_cache.record("drift", drift_fp, drift.outputs)
+        else:
+            logger.info("Train and test data unchanged. Skipping drift report")
 
         # -------------------- Model Evaluation ------------------
         logger.info("Stage: Model Evaluation")
-        metrics = ModelEvaluation(
-            metrics_cfg=cfg["metrics"],
-            data_cfg=cfg["data"],
-            s3_cfg=cfg["s3"]
-        ).evaluate(
-            new_model_path=model_path,
-            test_path=test_path
-        )
+        with timer.stage("evaluation"):
+            metrics = ModelEvaluation(
+                metrics_cfg=cfg["metrics"],
+                data_cfg=cfg["data"],
+                s3_cfg=cfg["s3"],
+                context=context
+            ).evaluate(
+                new_model_path=model_path,
+                test_path=test_path,
+                encoder_path=encoder_path
+            )
 
         # -------------------- Model Promotion -------------------
         if metrics.get("promote", False):
             logger.info("New model approved for promotion")
-            ModelPusher(cfg["s3"]).push(model_path)
+            with timer.stage("push"):
+                ModelPusher(cfg["s3"]).push(
+                    model_path,
+                    extra_files={
+                        cfg["s3"]["encoder_key"]: encoder_path,
+                        cfg["s3"]["artifact_key"]: artifact_path,
+                        cfg["s3"]["profile_key"]: profile_path
+                    }
+                )
         else:
             logger.info("New model rejected. Production model retained")
 
+        # -------------------- Timings ---------------------------
+        # Stages skipped by the stage cache have no entry
+        timer.record("total", time.perf_counter() - pipeline_start)
+        timer.save(
+            os.path.join(cfg["metrics"]["metrics_dir"], "pipeline_timings.json")
+        )
+        timer.log_to_mlflow(cfg["mlflow"])
+
         logger.info("=" * 70)
         logger.info("Pipeline completed successfully")
         logger.info("=" * 70)
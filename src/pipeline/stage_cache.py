@@ -0,0 +1,186 @@
+import os
+import json
+import pickle
+import hashlib
+import inspect
+import tempfile
+
+from src.logger.logger import logger
+
+
+class StageCache:
+    """
+    Content-hash based skipping of pipeline stages.
+
+    A stage's fingerprint is a hash of its input files, the config it
+    reads and the source of the code that runs it. The manifest maps each
+    stage to the fingerprint of its last successful run and the hashes of
+    the outputs it produced; when both still match, the stage is skipped
+    and its previous outputs are reused.
+
+    File hashes are memoised by (size, mtime), so an unchanged multi-GB
+    artifact is not re-read on every run. Picklable results (e.g. fitted
+    candidate models) can be stored with ``save_object``.
+    """
+
+    MANIFEST_FILE = "manifest.json"
+    OBJECTS_DIR = "objects"
+
+    def __init__(self, cache_dir: str, enabled: bool = True):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+
+        self.objects_dir = os.path.join(self.cache_dir, self.OBJECTS_DIR)
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self.manifest_path = os.path.join(self.cache_dir, self.MANIFEST_FILE)
+
+        self._manifest = self._read_manifest()
+
+    # -------------------- Fingerprints --------------------
+    def fingerprint(
+        self,
+        inputs: list = (),
+        config=None,
+        sources: list = ()
+    ) -> str:
+        """
+        Hash of the input files' contents, the JSON form of ``config`` and
+        the source files of ``sources`` (classes, functions or modules).
+        """
+        digest = hashlib.sha256()
+
+        for path in inputs:
+            digest.update(path.encode())
+            digest.update(self.file_hash(path).encode())
+
+        digest.update(
+            json.dumps(config, sort_keys=True, default=str).encode()
+        )
+
+        for obj in sources:
+            source_path = inspect.getsourcefile(obj)
+            digest.update(self.file_hash(source_path).encode())
+
+        return digest.hexdigest()
+
+    def file_hash(self, path: str) -> str:
+        stat = os.stat(path)
+        files = self._manifest["files"]
+
+        entry = files.get(path)
+        if (
+            entry
+            and entry["size"] == stat.st_size
+            and entry["mtime_ns"] == stat.st_mtime_ns
+        ):
+            return entry["sha256"]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+
+        files[path] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest.hexdigest()
+        }
+        return files[path]["sha256"]
+
+    # -------------------- Stages --------------------
+    def lookup(self, stage: str, fingerprint: str) -> list:
+        """
+        Outputs of the previous run of ``stage`` if it had the same
+        fingerprint and its outputs are unchanged on disk, else None.
+        """
+        if not self.enabled:
+            return None
+
+        entry = self._manifest["stages"].get(stage)
+        if entry is None or entry["fingerprint"] != fingerprint:
+            return None
+
+        for path, sha256 in entry["outputs"].items():
+            if not os.path.exists(path) or self.file_hash(path) != sha256:
+                logger.info(f"Stage cache: output {path} of {stage} changed")
+                return None
+
+        logger.info(f"Stage cache hit for {stage} ({fingerprint[:12]})")
+        return list(entry["outputs"])
+
+    def record(self, stage: str, fingerprint: str, outputs: list) -> None:
+        """
+        Remember a successful run of ``stage``. Objects stored for the
+        previous fingerprint of the stage are deleted.
+        """
+        if not self.enabled:
+            return
+
+        previous = self._manifest["stages"].get(stage)
+        if previous is not None:
+            for path in previous["outputs"]:
+                if path not in outputs and path.startswith(self.objects_dir):
+                    self._remove(path)
+
+        self._manifest["stages"][stage] = {
+            "fingerprint": fingerprint,
+            "outputs": {path: self.file_hash(path) for path in outputs}
+        }
+        self._write_manifest()
+
+    # -------------------- Objects --------------------
+    def load_object(self, stage: str, fingerprint: str):
+        """
+        Object saved for ``stage`` under ``fingerprint``, or None.
+        """
+        outputs = self.lookup(stage, fingerprint)
+        if outputs is None:
+            return None
+
+        with open(outputs[0], "rb") as f:
+            return pickle.load(f)
+
+    def save_object(self, stage: str, fingerprint: str, obj) -> None:
+        if not self.enabled:
+            return
+
+        safe_stage = stage.replace(os.sep, "_").replace(":", "_")
+        path = os.path.join(
+            self.objects_dir, f"{safe_stage}-{fingerprint[:16]}.pkl"
+        )
+        with open(path, "wb") as f:
+            pickle.dump(obj, f)
+
+        self.record(stage, fingerprint, [path])
+
+    # -------------------- Manifest --------------------
+    def _read_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+
+        manifest.setdefault("stages", {})
+        manifest.setdefault("files", {})
+        return manifest
+
+    def _write_manifest(self) -> None:
+        # Drop hashes of files that no longer exist
+        self._manifest["files"] = {
+            path: entry
+            for path, entry in self._manifest["files"].items()
+            if os.path.exists(path)
+        }
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(self._manifest, f, indent=4)
+        os.replace(tmp_path, self.manifest_path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,94 @@
+import numpy as np
+
+
+def _to_float(value) -> float:
+    if value is None:
+        raise ValueError("feature value is null")
+    if isinstance(value, bool):
+        raise TypeError(f"expected a number, got {value!r}")
+    return float(value)
+
+
+def records_to_matrix(records: list, feature_names: list):
+    """
+    Build a single float matrix from a list of JSON records.
+
+    Rows that cannot be converted are reported in ``errors`` and left out
+    of the returned matrix; ``row_index`` maps every matrix row back to
+    its position in the request.
+    """
+    n_features = len(feature_names)
+    X = np.empty((len(records), n_features), dtype=np.float64)
+    row_index = []
+    errors = []
+
+    for i, record in enumerate(records):
+        if not isinstance(record, dict):
+            errors.append({"index": i, "error": "record must be a JSON object"})
+            continue
+
+        try:
+            X[len(row_index)] = [
+                _to_float(record[name]) for name in feature_names
+            ]
+            row_index.append(i)
+        except KeyError as e:
+            errors.append({"index": i, "error": f"missing feature: {e.args[0]}"})
+        except (TypeError, ValueError) as e:
+            errors.append({"index": i, "error": str(e)})
+
+    return X[:len(row_index)], row_index, errors
+
+
+def columns_to_matrix(columns: dict, feature_names: list):
+    """
+    Build a single float matrix from a columnar payload
+    (``{feature: [v0, v1, ...]}``).
+
+    Each column is converted with one NumPy call; only columns containing
+    a bad value fall back to a per-element scan to find the failing rows.
+    """
+    missing = [name for name in feature_names if name not in columns]
+    if missing:
+        raise ValueError(f"missing feature columns: {missing}")
+
+    lengths = {len(columns[name]) for name in feature_names}
+    if len(lengths) != 1:
+        raise ValueError("all feature columns must have the same length")
+
+    n_rows = lengths.pop()
+    X = np.empty((n_rows, len(feature_names)), dtype=np.float64)
+    bad_rows = {}
+
+    for j, name in enumerate(feature_names):
+        values = columns[name]
+        try:
+            # JSON booleans would silently convert to 0/1
+            if not any(isinstance(v, bool) for v in values):
+                X[:, j] = np.asarray(values, dtype=np.float64)
+                if not np.isnan(X[:, j]).any():
+                    continue
+        except (TypeError, ValueError):
+            pass
+
+        for i, value in enumerate(values):
+            try:
+                X[i, j] = _to_float(value)
+            except (TypeError, ValueError):
+                X[i, j] = np.nan
+            if np.isnan(X[i, j]):
+                bad_rows.setdefault(
+                    i, f"invalid value for feature {name}: {value!r}"
+                )
+
+    if not bad_rows:
+        return X, list(range(n_rows)), []
+
+    keep = np.ones(n_rows, dtype=bool)
+    keep[list(bad_rows)] = False
+    errors = [
+        {"index": i, "error": message}
+        for i, message in sorted(bad_rows.items())
+    ]
+
+    return X[keep], np.flatnonzero(keep).tolist(), errors
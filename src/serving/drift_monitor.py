@@ -0,0 +1,174 @@
+import threading
+from bisect import bisect_right
+
+import numpy as np
+
+from src.components.drift_engine import DriftEngine
+
+
+class DriftMonitor:
+    """
+    Sliding-window drift scores for live prediction inputs.
+
+    Each request adds one count per feature to a fixed-size histogram laid
+    out like the model's ReferenceProfile bins, so an update costs the same
+    no matter how much traffic has been seen. The window is a ring of
+    ``n_sub_windows`` histograms: when the current one holds its share of
+    ``window_rows`` the oldest is cleared and reused. Scores are computed
+    only when ``report`` is called.
+
+    The monitor follows the profile it is given: observing with a different
+    profile (after a model reload) starts a fresh window.
+    """
+
+    def __init__(
+        self,
+        window_rows: int = 10000,
+        n_sub_windows: int = 10,
+        psi_threshold: float = 0.2
+    ):
+        self.window_rows = window_rows
+        self.n_sub_windows = n_sub_windows
+        self.sub_window_rows = max(1, window_rows // n_sub_windows)
+        self.psi_threshold = psi_threshold
+
+        self._lock = threading.Lock()
+        self._profile = None
+        self._engine = None
+        self._layout = []
+        self._counts = None
+        self._rows = None
+        self._slot = 0
+
+    # -------------------- Updates --------------------
+    def observe(self, profile, record: dict) -> None:
+        """
+        Add one raw request record to the current window.
+        """
+        if profile is not self._profile:
+            self._reset(profile)
+
+        with self._lock:
+            if profile is not self._profile:
+                return
+            indices = [
+                self._bin_index(spec, record.get(name))
+                for name, spec in self._layout
+            ]
+            self._counts[self._slot, indices] += 1
+            self._advance(1)
+
+    def observe_columns(self, profile, columns: dict, n_rows: int) -> None:
+        """
+        Add a batch given as {feature: values} with vectorized binning.
+        The whole batch lands in the current sub-window, so a large batch
+        can stretch the window past ``window_rows`` until it rotates out.
+        """
+        if profile is not self._profile:
+            self._reset(profile)
+
+        layout = self._layout
+        counts = []
+        for name, _ in layout:
+            values = columns.get(name)
+            if values is None:
+                values = [None] * n_rows
+            counts.append(profile.bin_counts(name, values))
+
+        with self._lock:
+            # Dropped if a reload reset the window meanwhile
+            if profile is not self._profile:
+                return
+            self._counts[self._slot] += np.concatenate(counts)
+            self._advance(n_rows)
+
+    def observe_records(self, profile, records: list) -> None:
+        records = [r for r in records if isinstance(r, dict)]
+        if not records:
+            return
+
+        if profile is not self._profile:
+            self._reset(profile)
+
+        columns = {
+            name: [record.get(name) for record in records]
+            for name, _ in self._layout
+        }
+        self.observe_columns(profile, columns, len(records))
+
+    # -------------------- Reporting --------------------
+    def report(self) -> dict:
+        if self._profile is None:
+            return {"window_rows": 0, "features": {}, "drifted_features": []}
+
+        with self._lock:
+            engine = self._engine
+            layout = self._layout
+            counts = self._counts.sum(axis=0)
+            rows = int(self._rows.sum())
+
+        feature_counts = {}
+        for name, spec in layout:
+            offset = spec["offset"]
+            feature_counts[name] = counts[
+                offset:offset + engine.profile.n_bins(name)
+            ]
+
+        report = engine.score_counts(feature_counts, rows)
+        report["window_rows"] = report.pop("n_rows")
+        return report
+
+    # -------------------- Internals --------------------
+    def _reset(self, profile) -> None:
+        layout = []
+        offset = 0
+        for name, feature in profile.features.items():
+            spec = {"type": feature["type"], "offset": offset}
+            n_bins = profile.n_bins(name)
+            if feature["type"] == "numeric":
+                spec["edges"] = feature["edges"]
+            else:
+                spec["lookup"] = {
+                    category: offset + i
+                    for i, category in enumerate(feature["categories"])
+                }
+                spec["other"] = offset + n_bins - 2
+            spec["missing"] = offset + n_bins - 1
+            layout.append((name, spec))
+            offset += n_bins
+
+        with self._lock:
+            if profile is self._profile:
+                return
+            self._layout = layout
+            self._counts = np.zeros((self.n_sub_windows, offset), dtype=np.int64)
+            self._rows = np.zeros(self.n_sub_windows, dtype=np.int64)
+            self._slot = 0
+            self._engine = DriftEngine(profile, self.psi_threshold)
+            self._profile = profile
+
+    @staticmethod
+    def _bin_index(spec: dict, value) -> int:
+        if value is None:
+            return spec["missing"]
+
+        if spec["type"] == "numeric":
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                return spec["missing"]
+            if value != value:
+                return spec["missing"]
+            return spec["offset"] + bisect_right(spec["edges"], value)
+
+        if not isinstance(value, str):
+            return spec["other"]
+        return spec["lookup"].get(value, spec["other"])
+
+    def _advance(self, n_rows: int) -> None:
+        # Caller holds the lock
+        self._rows[self._slot] += n_rows
+        if self._rows[self._slot] >= self.sub_window_rows:
+            self._slot = (self._slot + 1) % self.n_sub_windows
+            self._counts[self._slot] = 0
+            self._rows[self._slot] = 0
@@ -0,0 +1,66 @@
+import json
+
+from flask import Response
+
+try:
+    import orjson
+except ImportError:  # optional: the stdlib json module is the fallback
+    orjson = None
+
+
+JSON_MIMETYPE = "application/json"
+
+
+class RequestError(ValueError):
+    """
+    A client error in the request body, answered with ``status`` and a
+    JSON error message instead of a 500.
+    """
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def loads(body: bytes):
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def dumps(obj) -> bytes:
+    """
+    Compact JSON bytes. NaN/inf become null with orjson; the stdlib path
+    keeps json.dumps' behaviour.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def parse_body(request):
+    """
+    Decode the raw request body, bypassing Flask's get_json (content-type
+    negotiation, caching, BadRequest handling). Raises RequestError for an
+    empty or malformed body.
+    """
+    body = request.get_data(cache=False)
+    if not body:
+        raise RequestError("No input data provided")
+
+    try:
+        data = loads(body)
+    except ValueError as e:  # orjson.JSONDecodeError subclasses ValueError
+        raise RequestError(f"Malformed JSON: {e}")
+
+    if not data:
+        raise RequestError("No input data provided")
+    return data
+
+
+def json_response(obj, status: int = 200) -> Response:
+    """
+    A JSON response built directly from serialized bytes, without
+    jsonify's pretty-printing and app-context lookups.
+    """
+    return Response(dumps(obj), status=status, mimetype=JSON_MIMETYPE)
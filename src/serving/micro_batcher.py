@@ -0,0 +1,218 @@
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from src.logger.logger import logger
+
+
+class _PendingPrediction:
+    __slots__ = ("model", "features", "enqueued_at", "done", "result", "error")
+
+    def __init__(self, model, features):
+        self.model = model
+        self.features = features
+        self.enqueued_at = time.perf_counter()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-row predictions into one vectorized call.
+
+    Requests wait at most ``max_wait_ms`` (or until ``max_batch_size`` rows
+    are queued) before the batch is scored and results are handed back to
+    the waiting callers. Rows are grouped by the model they were submitted
+    with, so a hot reload never mixes two models in one call.
+    """
+
+    def __init__(
+        self,
+        max_wait_ms: float = 2.0,
+        max_batch_size: int = 64,
+        max_queue_size: int = 10000,
+        wait_samples: int = 10000
+    ):
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_batch_size = max_batch_size
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._worker = None
+        self._worker_pid = None
+
+        # Power-of-two buckets: 1, 2, 4, ... up to max_batch_size
+        self._bucket_bounds = []
+        bound = 1
+        while bound < max_batch_size:
+            self._bucket_bounds.append(bound)
+            bound *= 2
+        self._bucket_bounds.append(max_batch_size)
+
+        self._batch_size_counts = [0] * len(self._bucket_bounds)
+        self._wait_times = deque(maxlen=wait_samples)
+        self._batches = 0
+        self._rows = 0
+        self._errors = 0
+
+        logger.info(
+            f"MicroBatcher initialized with max_wait_ms={max_wait_ms}, "
+            f"max_batch_size={max_batch_size}"
+        )
+
+    # -------------------- Public API --------------------
+    def submit(self, model, features, timeout: float = 30.0) -> float:
+        """
+        Queue one feature row and block until its prediction is ready.
+        """
+        features = np.asarray(features, dtype=np.float64)
+        if features.ndim != 1:
+            raise ValueError("Expected a single flat feature row")
+
+        self._ensure_worker()
+
+        pending = _PendingPrediction(model, features)
+        self._queue.put(pending, timeout=timeout)
+
+        if not pending.done.wait(timeout):
+            raise TimeoutError("Timed out waiting for batched prediction")
+
+        if pending.error is not None:
+            raise pending.error
+
+        return pending.result
+
+    def stats(self) -> dict:
+        with self._lock:
+            waits_ms = np.fromiter(self._wait_times, dtype=np.float64) * 1000.0
+            histogram = {
+                f"le_{bound}": count
+                for bound, count in zip(
+                    self._bucket_bounds, self._batch_size_counts
+                )
+            }
+            batches, rows, errors = self._batches, self._rows, self._errors
+
+        wait_stats = {"avg": None, "p50": None, "p99": None, "max": None}
+        if waits_ms.size:
+            wait_stats = {
+                "avg": float(waits_ms.mean()),
+                "p50": float(np.percentile(waits_ms, 50)),
+                "p99": float(np.percentile(waits_ms, 99)),
+                "max": float(waits_ms.max())
+            }
+
+        return {
+            "queue_depth": self._queue.qsize(),
+            "batches": batches,
+            "rows": rows,
+            "errors": errors,
+            "avg_batch_size": rows / batches if batches else None,
+            "batch_size_histogram": histogram,
+            "added_wait_ms": wait_stats
+        }
+
+    # -------------------- Worker --------------------
+    def _ensure_worker(self) -> None:
+        # Threads do not survive fork, so a forked worker starts its own
+        if self._worker_pid == os.getpid() and self._worker.is_alive():
+            return
+
+        with self._lock:
+            if self._worker_pid == os.getpid() and self._worker.is_alive():
+                return
+
+            self._worker = threading.Thread(
+                target=self._run, name="micro-batcher", daemon=True
+            )
+            self._worker.start()
+            self._worker_pid = os.getpid()
+
+    def _collect(self) -> list:
+        first = self._queue.get()
+        batch = [first]
+
+        # Everything already queued joins without waiting: under a backlog
+        # the first row's window has long passed, but the rows behind it
+        # are ready to go in the same call
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        # Then wait for new arrivals for what is left of the window
+        deadline = first.enqueued_at + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            dispatched_at = time.perf_counter()
+
+            groups = {}
+            for pending in batch:
+                groups.setdefault(id(pending.model), []).append(pending)
+
+            failed = False
+            for group in groups.values():
+                failed |= self._predict_group(group)
+
+            for pending in batch:
+                pending.done.set()
+
+            self._record(batch, dispatched_at, failed)
+
+    @staticmethod
+    def _predict_group(group: list) -> bool:
+        width = group[0].features.shape[0]
+        rows = []
+        for pending in group:
+            if pending.features.shape[0] == width:
+                rows.append(pending)
+            else:
+                pending.error = ValueError(
+                    f"Expected {width} features, "
+                    f"got {pending.features.shape[0]}"
+                )
+
+        try:
+            predictions = group[0].model.predict(
+                np.stack([p.features for p in rows])
+            )
+            for pending, value in zip(rows, predictions):
+                pending.result = float(value)
+            return False
+        except Exception as e:
+            logger.error("Micro-batch prediction failed", exc_info=True)
+            for pending in rows:
+                pending.error = e
+            return True
+
+    def _record(self, batch: list, dispatched_at: float, failed: bool) -> None:
+        size = len(batch)
+        with self._lock:
+            self._batches += 1
+            self._rows += size
+            self._errors += int(failed)
+            for i, bound in enumerate(self._bucket_bounds):
+                if size <= bound:
+                    self._batch_size_counts[i] += 1
+                    break
+            self._wait_times.extend(
+                dispatched_at - p.enqueued_at for p in batch
+            )
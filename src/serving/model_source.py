@@ -0,0 +1,193 @@
+import os
+import time
+import pickle
+import hashlib
+
+import joblib
+
+from src.logger.logger import logger
+from src.components.feature_encoder import FeatureEncoder
+from src.components.reference_profile import ReferenceProfile
+from src.serving.model_store import ModelBundle
+
+
+def _load_bundle(
+    artifact_path,
+    model_path,
+    encoder_path,
+    version,
+    profile_path=None,
+    large_batch_model=False
+):
+    """
+    Load a ModelBundle, preferring the memory-mapped joblib artifact over
+    the pickled model.
+
+    With ``large_batch_model`` the pickled sklearn model is loaded as well
+    (on the loading thread, from the same version) for large batches. It
+    costs the sklearn import and a private in-memory copy per process.
+    """
+    start = time.perf_counter()
+
+    model = None
+    batch_model = None
+    if artifact_path is not None:
+        try:
+            model = joblib.load(artifact_path, mmap_mode="r")
+            logger.info("Model loaded from memory-mapped artifact")
+        except Exception:
+            logger.warning(
+                "Model artifact unavailable. Falling back to pickled model"
+            )
+
+    if model is None:
+        with open(model_path, "rb") as f:
+            model = pickle.load(f)
+        logger.info("Model loaded successfully into memory")
+    elif large_batch_model:
+        with open(model_path, "rb") as f:
+            batch_model = pickle.load(f)
+        logger.info("Large-batch model loaded into memory")
+
+    encoder = None
+    if encoder_path is not None:
+        encoder = FeatureEncoder.load(encoder_path)
+        logger.info(
+            f"Feature encoder loaded with {encoder.n_features} features"
+        )
+    else:
+        logger.warning(
+            "No feature encoder stored with the model. "
+            "Falling back to request key order"
+        )
+
+    profile = None
+    if profile_path is not None:
+        profile = ReferenceProfile.load(profile_path)
+        logger.info(
+            f"Reference profile loaded for {len(profile.features)} features"
+        )
+
+    return ModelBundle(
+        model=model,
+        encoder=encoder,
+        version=version,
+        profile=profile,
+        load_seconds=time.perf_counter() - start,
+        large_batch_model=batch_model
+    )
+
+
+class S3ModelSource:
+    """
+    Model published by ModelPusher to S3, fetched through the local
+    ModelCache. The model key is uploaded last, so its version identifies
+    a complete model/encoder/artifact set.
+    """
+
+    def __init__(
+        self,
+        model_cache,
+        bucket: str,
+        model_key: str,
+        artifact_key: str,
+        encoder_key: str,
+        profile_key: str = None,
+        large_batch_model: bool = False
+    ):
+        self.model_cache = model_cache
+        self.bucket = bucket
+        self.model_key = model_key
+        self.artifact_key = artifact_key
+        self.encoder_key = encoder_key
+        self.profile_key = profile_key
+        self.large_batch_model = large_batch_model
+
+    def version(self) -> str:
+        remote = self.model_cache.head(self.bucket, self.model_key)
+        return remote["version_id"] or remote["etag"]
+
+    def _fetch_optional(self, key: str):
+        try:
+            return self.model_cache.fetch(self.bucket, key)
+        except Exception:
+            logger.warning(f"s3://{self.bucket}/{key} is not available")
+            return None
+
+    def load(self) -> ModelBundle:
+        version = self.version()
+        logger.info(
+            f"Fetching model s3://{self.bucket}/{self.model_key} "
+            f"(version {version})"
+        )
+
+        return _load_bundle(
+            artifact_path=self._fetch_optional(self.artifact_key),
+            model_path=self.model_cache.fetch(self.bucket, self.model_key),
+            encoder_path=self._fetch_optional(self.encoder_key),
+            version=version,
+            profile_path=(
+                self._fetch_optional(self.profile_key)
+                if self.profile_key else None
+            ),
+            large_batch_model=self.large_batch_model
+        )
+
+
+class LocalModelSource:
+    """
+    Model read from a local directory laid out like artifacts/model; a
+    stand-in for S3 in development and tests. The version is derived from
+    file sizes and modification times.
+    """
+
+    def __init__(
+        self,
+        model_dir: str,
+        model_name: str = "model.pkl",
+        artifact_name: str = "model.joblib",
+        encoder_name: str = "encoder.pkl",
+        profile_name: str = "reference_profile.json",
+        large_batch_model: bool = False
+    ):
+        self.model_dir = model_dir
+        self.model_name = model_name
+        self.artifact_name = artifact_name
+        self.encoder_name = encoder_name
+        self.profile_name = profile_name
+        self.large_batch_model = large_batch_model
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.model_dir, name)
+
+    def version(self) -> str:
+        digest = hashlib.sha256()
+        names = (
+            self.model_name,
+            self.artifact_name,
+            self.encoder_name,
+            self.profile_name
+        )
+        for name in names:
+            path = self._path(name)
+            if os.path.exists(path):
+                stat = os.stat(path)
+                digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        return digest.hexdigest()[:16]
+
+    def load(self) -> ModelBundle:
+        version = self.version()
+        logger.info(f"Loading model from {self.model_dir} (version {version})")
+
+        artifact_path = self._path(self.artifact_name)
+        encoder_path = self._path(self.encoder_name)
+        profile_path = self._path(self.profile_name)
+
+        return _load_bundle(
+            artifact_path=artifact_path if os.path.exists(artifact_path) else None,
+            model_path=self._path(self.model_name),
+            encoder_path=encoder_path if os.path.exists(encoder_path) else None,
+            version=version,
+            profile_path=profile_path if os.path.exists(profile_path) else None,
+            large_batch_model=self.large_batch_model
+        )
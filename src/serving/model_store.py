@@ -0,0 +1,108 @@
+import time
+import threading
+
+import numpy as np
+
+
+class ModelBundle:
+    """
+    A model, its feature encoder, the reference profile of its training
+    inputs (used for drift monitoring) and the version they were loaded
+    from.
+
+    ``large_batch_model`` is the optional, already loaded sklearn model
+    behind a flattened serving artifact: the flat walk wins on small
+    batches, sklearn's compiled predict on large ones (see ``model_for``).
+
+    Bundles are never mutated after creation, so a request that grabbed one
+    keeps a consistent model/encoder pair even if a reload swaps it out.
+    """
+
+    __slots__ = (
+        "model", "encoder", "profile", "version", "loaded_at", "load_seconds",
+        "large_batch_model"
+    )
+
+    def __init__(
+        self,
+        model,
+        encoder,
+        version: str,
+        profile=None,
+        load_seconds: float = None,
+        large_batch_model=None
+    ):
+        self.model = model
+        self.encoder = encoder
+        self.profile = profile
+        self.version = version
+        self.loaded_at = time.time()
+        self.load_seconds = load_seconds
+        self.large_batch_model = large_batch_model
+
+    def model_for(self, n_rows: int, max_flat_rows: int):
+        """
+        The model to score ``n_rows`` rows with: the large-batch model
+        above ``max_flat_rows`` when there is one, otherwise the serving
+        model.
+        """
+        if self.large_batch_model is not None and n_rows > max_flat_rows:
+            return self.large_batch_model
+        return self.model
+
+    @property
+    def n_features(self):
+        if self.encoder is not None:
+            return self.encoder.n_features
+        return getattr(
+            self.model, "n_features_in_",
+            getattr(self.model, "n_features", None)
+        )
+
+    def warm_up(self) -> None:
+        """
+        Run one prediction so lazy initialisation (and page faults on
+        memory-mapped arrays) happen before the bundle takes traffic.
+        """
+        if self.n_features is None:
+            raise ValueError("Cannot determine feature count for warm-up")
+
+        for model in (self.model, self.large_batch_model):
+            if model is None:
+                continue
+            prediction = model.predict(np.zeros((1, self.n_features)))
+            if not np.all(np.isfinite(prediction)):
+                raise ValueError("Warm-up prediction is not finite")
+
+    def describe(self) -> dict:
+        return {
+            "version": self.version,
+            "loaded_at": self.loaded_at,
+            "model_type": type(self.model).__name__,
+            "large_batch_model_type": (
+                type(self.large_batch_model).__name__
+                if self.large_batch_model is not None else None
+            ),
+            "n_features": self.n_features,
+            "load_seconds": self.load_seconds
+        }
+
+
+class ModelStore:
+    """
+    Holds the active ModelBundle. Readers take a plain reference (no lock on
+    the request path); reloads replace it with a single atomic assignment.
+    """
+
+    def __init__(self, bundle: ModelBundle):
+        self._bundle = bundle
+        self._swap_lock = threading.Lock()
+
+    def get(self) -> ModelBundle:
+        return self._bundle
+
+    def swap(self, bundle: ModelBundle) -> ModelBundle:
+        with self._swap_lock:
+            previous = self._bundle
+            self._bundle = bundle
+        return previous
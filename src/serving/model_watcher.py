@@ -0,0 +1,88 @@
+import os
+import threading
+
+from src.logger.logger import logger
+
+
+class ModelWatcher:
+    """
+    Background thread that polls a model source and hot-swaps new versions
+    into the ModelStore.
+
+    Loading and warm-up happen entirely on the watcher thread; requests keep
+    using the current bundle until the new one has passed warm-up and is
+    swapped in with a single reference assignment.
+    """
+
+    def __init__(self, source, store, interval_seconds: float = 30.0):
+        self.source = source
+        self.store = store
+        self.interval_seconds = interval_seconds
+
+        self.last_error = None
+        self.reloads = 0
+
+        self._stop = threading.Event()
+        self._thread = None
+        self._thread_pid = None
+
+    def start(self) -> None:
+        # Threads do not survive fork, so each worker process starts its own
+        if self._thread_pid == os.getpid() and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="model-watcher", daemon=True
+        )
+        self._thread.start()
+        self._thread_pid = os.getpid()
+
+        logger.info(
+            f"ModelWatcher started, polling every {self.interval_seconds}s"
+        )
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def check_once(self) -> bool:
+        """
+        Reload if the source has a new version. Returns True on a swap.
+        """
+        version = self.source.version()
+        active = self.store.get()
+
+        if version == active.version:
+            return False
+
+        logger.info(
+            f"New model version detected: {active.version} -> {version}"
+        )
+
+        bundle = self.source.load()
+        bundle.warm_up()
+
+        self.store.swap(bundle)
+        self.reloads += 1
+
+        logger.info(f"Model version {bundle.version} is now active")
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.check_once()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(
+                    "Model reload failed. Keeping active model",
+                    exc_info=True
+                )
+
+    def status(self) -> dict:
+        return {
+            "interval_seconds": self.interval_seconds,
+            "reloads": self.reloads,
+            "last_error": self.last_error
+        }
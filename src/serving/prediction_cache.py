@@ -0,0 +1,113 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+class PredictionCache:
+    """
+    Bounded LRU cache of predictions keyed by model version and a hash of
+    the encoded feature vector.
+
+    Entries expire after ``ttl_seconds`` and the least recently used are
+    evicted once the estimated size exceeds ``max_bytes``. The cache only
+    ever holds entries for one model version: the first lookup with a new
+    version drops everything, so a hot reload cannot serve stale results.
+    """
+
+    # Rough per-entry footprint: 16-byte digest key, float value, expiry
+    # and the OrderedDict node
+    ENTRY_BYTES = 200
+
+    def __init__(self, max_bytes: int, ttl_seconds: float = 300.0):
+        self.max_entries = max(1, max_bytes // self.ENTRY_BYTES)
+        self.ttl = ttl_seconds
+
+        self._entries = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(features) -> bytes:
+        row = np.ascontiguousarray(features, dtype=np.float64)
+        return hashlib.blake2b(row.tobytes(), digest_size=16).digest()
+
+    def _check_version(self, version: str) -> None:
+        # Caller holds the lock
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._version = version
+
+    def get(self, version: str, key: bytes):
+        """
+        Cached prediction for ``key`` under ``version``, or None.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._check_version(version)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, version: str, key: bytes, value: float) -> None:
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._check_version(version)
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_many(self, version: str, X: np.ndarray):
+        """
+        Look up every row of ``X``. Returns ``(keys, values)`` where
+        ``values[i]`` is None for rows that have to be scored.
+        """
+        keys = [self.key(row) for row in X]
+        return keys, [self.get(version, key) for key in keys]
+
+    def put_many(self, version: str, keys: list, values: list) -> None:
+        for key, value in zip(keys, values):
+            self.put(version, key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "model_version": self._version
+        }
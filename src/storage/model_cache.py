@@ -0,0 +1,166 @@
+import os
+import json
+import time
+import fcntl
+import hashlib
+import tempfile
+from contextlib import contextmanager
+
+from src.logger.logger import logger
+
+
+class ModelCache:
+    """
+    Content-addressed local cache for S3 model artifacts.
+
+    Entries are keyed by the object's VersionId (or ETag when versioning is
+    off), so a HEAD request is enough to tell whether the cached copy is
+    current. The cache is bounded by ``max_bytes`` and evicts the least
+    recently used entries. A file lock makes it safe to share between
+    processes (e.g. several Gunicorn workers).
+
+    Objects are read through a storage backend (src.storage.s3), so
+    downloads are checksum-verified and a local directory can stand in
+    for S3.
+    """
+
+    INDEX_FILE = "index.json"
+    LOCK_FILE = ".lock"
+
+    def __init__(self, cache_dir: str, max_bytes: int, storage):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.storage = storage
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+
+    # -------------------- Public API --------------------
+    def head(self, bucket: str, key: str) -> dict:
+        return self.storage.head(bucket, key)
+
+    def fetch(self, bucket: str, key: str) -> str:
+        """
+        Return a local path holding the current version of s3://bucket/key,
+        downloading it only when the cached copy is missing or stale.
+        """
+        try:
+            remote = self.head(bucket, key)
+        except Exception:
+            cached = self._latest_entry(bucket, key)
+            if cached is None:
+                raise
+            logger.warning(
+                f"HEAD s3://{bucket}/{key} failed. "
+                f"Using cached copy {cached['path']}"
+            )
+            return cached["path"]
+
+        entry_id = self._entry_id(bucket, key, remote)
+
+        with self._locked():
+            index = self._read_index()
+            entry = index.get(entry_id)
+
+            if entry and os.path.exists(entry["path"]):
+                entry["last_access"] = time.time()
+                self._write_index(index)
+                logger.info(
+                    f"Model cache hit for s3://{bucket}/{key} "
+                    f"(version {remote['version_id'] or remote['etag']})"
+                )
+                return entry["path"]
+
+            logger.info(
+                f"Model cache miss for s3://{bucket}/{key}. "
+                f"Downloading {remote['size']} bytes"
+            )
+
+            entry_dir = os.path.join(self.cache_dir, entry_id)
+            os.makedirs(entry_dir, exist_ok=True)
+            path = os.path.join(entry_dir, os.path.basename(key))
+
+            fd, tmp_path = tempfile.mkstemp(dir=entry_dir, suffix=".part")
+            os.close(fd)
+            try:
+                self.storage.download(bucket, key, tmp_path, remote=remote)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+            index[entry_id] = {
+                "bucket": bucket,
+                "key": key,
+                "etag": remote["etag"],
+                "version_id": remote["version_id"],
+                "size": os.path.getsize(path),
+                "path": path,
+                "last_access": time.time()
+            }
+            self._evict(index, keep=entry_id)
+            self._write_index(index)
+
+            return path
+
+    # -------------------- Internals --------------------
+    @staticmethod
+    def _entry_id(bucket: str, key: str, remote: dict) -> str:
+        version = remote["version_id"] or remote["etag"]
+        return hashlib.sha256(
+            f"{bucket}/{key}@{version}".encode()
+        ).hexdigest()[:32]
+
+    def _latest_entry(self, bucket: str, key: str):
+        with self._locked():
+            entries = [
+                e for e in self._read_index().values()
+                if e["bucket"] == bucket and e["key"] == key
+                and os.path.exists(e["path"])
+            ]
+        return max(entries, key=lambda e: e["last_access"], default=None)
+
+    def _evict(self, index: dict, keep: str) -> None:
+        total = sum(e["size"] for e in index.values())
+        by_age = sorted(index.items(), key=lambda item: item[1]["last_access"])
+
+        for entry_id, entry in by_age:
+            if total <= self.max_bytes:
+                break
+            if entry_id == keep:
+                continue
+
+            # Open memory maps keep the unlinked file alive until unmapped
+            if os.path.exists(entry["path"]):
+                os.remove(entry["path"])
+            entry_dir = os.path.dirname(entry["path"])
+            if os.path.isdir(entry_dir) and not os.listdir(entry_dir):
+                os.rmdir(entry_dir)
+
+            total -= entry["size"]
+            del index[entry_id]
+            logger.info(
+                f"Evicted s3://{entry['bucket']}/{entry['key']} "
+                f"({entry['size']} bytes) from model cache"
+            )
+
+    def _read_index(self) -> dict:
+        if not os.path.exists(self.index_path):
+            return {}
+        with open(self.index_path, "r") as f:
+            return json.load(f)
+
+    def _write_index(self, index: dict) -> None:
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(index, f, indent=4)
+        os.replace(tmp_path, self.index_path)
+
+    @contextmanager
+    def _locked(self):
+        with open(os.path.join(self.cache_dir, self.LOCK_FILE), "w") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
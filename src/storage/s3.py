@@ -0,0 +1,220 @@
+import os
+import shutil
+import hashlib
+import tempfile
+import threading
+
+from src.logger.logger import logger
+
+
+# Object metadata key holding the SHA-256 of the uploaded file. ETags are
+# not content hashes for multipart uploads, so this is what downloads are
+# verified against.
+CHECKSUM_METADATA_KEY = "sha256"
+
+_HASH_BLOCK_BYTES = 1024 * 1024
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_s3_client(max_pool_connections: int = 20):
+    """
+    The process-wide boto3 S3 client, created on first use.
+
+    Clients are thread-safe but expensive to build and hold a connection
+    pool, so one is shared by every caller in the process. The cache is
+    keyed by pid: a client inherited across fork is never reused.
+    """
+    cache_key = (os.getpid(), max_pool_connections)
+    client = _clients.get(cache_key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(cache_key)
+        if client is None:
+            import boto3
+            from botocore.config import Config
+
+            client = boto3.session.Session().client(
+                "s3",
+                config=Config(
+                    max_pool_connections=max_pool_connections,
+                    retries={"max_attempts": 5, "mode": "adaptive"},
+                    tcp_keepalive=True
+                )
+            )
+            _clients[cache_key] = client
+            logger.info(
+                f"S3 client created for pid {os.getpid()} "
+                f"(pool size {max_pool_connections})"
+            )
+    return client
+
+
+class S3Backend:
+    """
+    Object storage on S3 through the shared per-process client.
+
+    Large objects are moved with multipart, concurrent transfers; uploads
+    carry the file's SHA-256 as metadata and downloads are verified
+    against it before they are handed out.
+    """
+
+    def __init__(
+        self,
+        multipart_threshold_mb: int = 8,
+        multipart_chunksize_mb: int = 16,
+        max_concurrency: int = 10,
+        max_pool_connections: int = 20
+    ):
+        from boto3.s3.transfer import TransferConfig
+
+        self.max_pool_connections = max(max_pool_connections, max_concurrency)
+        self.transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold_mb * 1024 * 1024,
+            multipart_chunksize=multipart_chunksize_mb * 1024 * 1024,
+            max_concurrency=max_concurrency,
+            use_threads=True
+        )
+
+    @property
+    def client(self):
+        return get_s3_client(self.max_pool_connections)
+
+    def head(self, bucket: str, key: str) -> dict:
+        response = self.client.head_object(Bucket=bucket, Key=key)
+        return {
+            "etag": response["ETag"].strip('"'),
+            "version_id": response.get("VersionId"),
+            "size": response["ContentLength"],
+            "sha256": response.get("Metadata", {}).get(CHECKSUM_METADATA_KEY)
+        }
+
+    def download(
+        self, bucket: str, key: str, path: str, remote: dict = None
+    ) -> dict:
+        """
+        Download s3://bucket/key to ``path`` and return its head. A head
+        the caller already has is reused; the download is pinned to its
+        version so the checksum always matches.
+        """
+        remote = remote or self.head(bucket, key)
+        extra_args = (
+            {"VersionId": remote["version_id"]} if remote["version_id"] else None
+        )
+        self.client.download_file(
+            bucket, key, path,
+            ExtraArgs=extra_args,
+            Config=self.transfer_config
+        )
+        _verify(path, remote, f"s3://{bucket}/{key}")
+        return remote
+
+    def upload(self, path: str, bucket: str, key: str) -> None:
+        self.client.upload_file(
+            Filename=path,
+            Bucket=bucket,
+            Key=key,
+            ExtraArgs={"Metadata": {CHECKSUM_METADATA_KEY: file_sha256(path)}},
+            Config=self.transfer_config
+        )
+
+
+class LocalBackend:
+    """
+    Filesystem stand-in for S3 in tests and benchmarks: objects live at
+    ``root/bucket/key`` with their SHA-256 in a ``.sha256`` sidecar. The
+    ETag is derived from size and modification time; there are no
+    versions.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, bucket: str, key: str) -> str:
+        return os.path.join(self.root, bucket, key)
+
+    def head(self, bucket: str, key: str) -> dict:
+        path = self._path(bucket, key)
+        stat = os.stat(path)  # FileNotFoundError like a 404
+
+        checksum = None
+        if os.path.exists(path + ".sha256"):
+            with open(path + ".sha256", "r") as f:
+                checksum = f.read().strip()
+
+        return {
+            "etag": hashlib.md5(
+                f"{stat.st_size}:{stat.st_mtime_ns}".encode()
+            ).hexdigest(),
+            "version_id": None,
+            "size": stat.st_size,
+            "sha256": checksum
+        }
+
+    def download(
+        self, bucket: str, key: str, path: str, remote: dict = None
+    ) -> dict:
+        remote = remote or self.head(bucket, key)
+        shutil.copyfile(self._path(bucket, key), path)
+        _verify(path, remote, f"{self.root}/{bucket}/{key}")
+        return remote
+
+    def upload(self, path: str, bucket: str, key: str) -> None:
+        target = self._path(bucket, key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+        # Same visibility as S3: readers see the old object or the new one
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(target), suffix=".part"
+        )
+        os.close(fd)
+        try:
+            shutil.copyfile(path, tmp_path)
+            with open(target + ".sha256", "w") as f:
+                f.write(file_sha256(tmp_path))
+            os.replace(tmp_path, target)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def _verify(path: str, remote: dict, source: str) -> None:
+    expected = remote.get("sha256")
+    if expected is None:
+        return
+
+    actual = file_sha256(path)
+    if actual != expected:
+        os.remove(path)
+        raise ValueError(
+            f"Checksum mismatch for {source}: expected {expected}, got {actual}"
+        )
+
+
+def get_storage(s3_cfg: dict):
+    """
+    Storage backend selected by ``s3_cfg["backend"]`` ("s3" or "local").
+    """
+    backend = s3_cfg.get("backend", "s3")
+
+    if backend == "local":
+        return LocalBackend(s3_cfg.get("local_root", ".local_s3"))
+    if backend == "s3":
+        return S3Backend(
+            multipart_threshold_mb=s3_cfg.get("multipart_threshold_mb", 8),
+            multipart_chunksize_mb=s3_cfg.get("multipart_chunksize_mb", 16),
+            max_concurrency=s3_cfg.get("max_concurrency", 10),
+            max_pool_connections=s3_cfg.get("max_pool_connections", 20)
+        )
+    raise ValueError(f"Unknown storage backend: {backend}")
@@ -0,0 +1,117 @@
+from src.logger.logger import logger
+from src.utils.frame_io import iter_frame, read_frame, write_frame
+
+
+class ArtifactContext:
+    """
+    Hands DataFrames (and encoded feature matrices) from one pipeline stage
+    to the next without re-reading them from disk.
+
+    Artifacts are still addressed by path, so stages keep their path-based
+    interfaces; ``persist`` controls whether a write also goes to disk (DVC
+    outputs must). With ``keep_in_memory=False`` the context is a plain
+    pass-through to frame_io. With ``free_after_last_use=True`` a frame is
+    dropped as soon as the number of reads announced via ``expect`` has
+    been served, which bounds peak memory.
+
+    Frames are shared, not copied: stages must not modify them in place.
+    """
+
+    def __init__(self, keep_in_memory: bool = True, free_after_last_use: bool = False):
+        self.keep_in_memory = keep_in_memory
+        self.free_after_last_use = free_after_last_use
+
+        self._frames = {}
+        self._features = {}
+        self._remaining_reads = {}
+
+    # -------------------- Frames --------------------
+    def write(self, df, path: str, persist: bool = True) -> str:
+        if persist:
+            write_frame(df, path)
+        if self.keep_in_memory:
+            self._frames[path] = df
+        return path
+
+    def read(self, path: str, columns: list = None):
+        df = self._frames.get(path)
+
+        if df is None:
+            if not self.keep_in_memory:
+                return read_frame(path, columns=columns)
+
+            # Load every column once so later stages can be served from memory
+            df = read_frame(path)
+            self._frames[path] = df
+            logger.info(f"Loaded {path} into artifact context")
+        else:
+            logger.info(f"Serving {path} from artifact context")
+
+        self._consume(path)
+        return df[columns] if columns is not None else df
+
+    def iter_chunks(self, path: str, chunk_size: int, columns: list = None):
+        """
+        Yield the artifact in chunks of at most ``chunk_size`` rows: slices
+        of the frame when it is already in memory (counted as one read),
+        otherwise streamed from disk without loading the whole file.
+        """
+        df = self._frames.get(path)
+
+        if df is None:
+            logger.info(f"Streaming {path} in chunks of {chunk_size} rows")
+            yield from iter_frame(path, chunk_size, columns=columns)
+            return
+
+        logger.info(f"Serving {path} from artifact context in chunks")
+        self._consume(path)
+        if columns is not None:
+            df = df[columns]
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size]
+
+    # -------------------- Feature matrices --------------------
+    def features(self, path: str, encoder, df=None):
+        """
+        Encoded feature matrix for the artifact at ``path``, computed once
+        per (path, encoder) and released together with the frame. Pass
+        ``df`` when the caller already holds the frame.
+        """
+        key = (path, id(encoder))
+        cached = self._features.get(key)
+        if cached is not None:
+            return cached[1]
+
+        # A frame already in memory is reused without counting another read
+        if df is None:
+            df = self._frames.get(path)
+        if df is None:
+            df = self.read(path)
+
+        X = encoder.transform(df)
+        if path in self._frames:
+            # The encoder is kept alongside so its id cannot be reused
+            self._features[key] = (encoder, X)
+        return X
+
+    # -------------------- Lifetime --------------------
+    def expect(self, path: str, reads: int) -> None:
+        """
+        Announce how many more times ``path`` will be read.
+        """
+        self._remaining_reads[path] = reads
+
+    def _consume(self, path: str) -> None:
+        if not self.free_after_last_use or path not in self._remaining_reads:
+            return
+
+        self._remaining_reads[path] -= 1
+        if self._remaining_reads[path] <= 0:
+            self.release(path)
+
+    def release(self, path: str) -> None:
+        self._frames.pop(path, None)
+        self._remaining_reads.pop(path, None)
+        for key in [k for k in self._features if k[0] == path]:
+            del self._features[key]
+        logger.info(f"Released {path} from artifact context")
@@ -0,0 +1,155 @@
+import os
+
+import pandas as pd
+
+
+# Artifact format name -> file extension
+FORMATS = {
+    "csv": "csv",
+    "parquet": "parquet",
+    "feather": "arrow",
+}
+
+PARQUET_COMPRESSION = "zstd"
+
+
+def artifact_path(directory: str, name: str, fmt: str = "csv") -> str:
+    """
+    Path of a tabular artifact, e.g. artifact_path("artifacts/raw",
+    "housing", "parquet") -> "artifacts/raw/housing.parquet".
+    """
+    if fmt not in FORMATS:
+        raise ValueError(
+            f"Unsupported artifact format: {fmt}. "
+            f"Expected one of {list(FORMATS)}"
+        )
+    return os.path.join(directory, f"{name}.{FORMATS[fmt]}")
+
+
+def _format_of(path: str) -> str:
+    ext = os.path.splitext(path)[1].lstrip(".").lower()
+    for fmt, fmt_ext in FORMATS.items():
+        if ext == fmt_ext:
+            return fmt
+    raise ValueError(f"Cannot infer artifact format from path: {path}")
+
+
+def read_frame(path: str, columns: list = None) -> pd.DataFrame:
+    """
+    Read a tabular artifact, optionally only the given columns. The format
+    is taken from the file extension.
+    """
+    fmt = _format_of(path)
+
+    if fmt == "parquet":
+        return pd.read_parquet(path, columns=columns)
+    if fmt == "feather":
+        return pd.read_feather(path, columns=columns)
+    return pd.read_csv(path, usecols=columns)
+
+
+def iter_frame(path: str, chunk_size: int, columns: list = None):
+    """
+    Yield a tabular artifact as DataFrames of at most ``chunk_size`` rows,
+    so files larger than memory can be processed incrementally.
+    """
+    fmt = _format_of(path)
+
+    if fmt == "csv":
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunk_size)
+        return
+
+    import pyarrow as pa
+
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        batches = pq.ParquetFile(path).iter_batches(
+            batch_size=chunk_size, columns=columns
+        )
+        for batch in batches:
+            yield batch.to_pandas()
+        return
+
+    # Feather (Arrow IPC): record batches are read from a memory map
+    with pa.memory_map(path, "r") as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            if columns is not None:
+                batch = batch.select(columns)
+            for start in range(0, batch.num_rows, chunk_size):
+                yield batch.slice(start, chunk_size).to_pandas()
+
+
+def write_frame(df: pd.DataFrame, path: str) -> str:
+    """
+    Write a tabular artifact in the format implied by the file extension.
+    Columnar formats keep dtypes, so later stages see exactly what was
+    written instead of re-inferring types from text.
+    """
+    fmt = _format_of(path)
+
+    if fmt == "parquet":
+        df.to_parquet(path, index=False, compression=PARQUET_COMPRESSION)
+    elif fmt == "feather":
+        df.reset_index(drop=True).to_feather(path)
+    else:
+        df.to_csv(path, index=False)
+
+    return path
+
+
+class FrameWriter:
+    """
+    Appends DataFrame chunks to a single artifact, so data larger than
+    memory can be written incrementally. The first chunk fixes the schema;
+    later chunks are cast to it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.fmt = _format_of(path)
+        self._writer = None
+        self._schema = None
+        self._header_written = False
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        if self.fmt == "csv":
+            chunk.to_csv(
+                self.path,
+                mode="a" if self._header_written else "w",
+                header=not self._header_written,
+                index=False
+            )
+            self._header_written = True
+            return
+
+        import pyarrow as pa
+
+        if self._writer is None:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            self._schema = table.schema
+            if self.fmt == "parquet":
+                import pyarrow.parquet as pq
+                self._writer = pq.ParquetWriter(
+                    self.path, self._schema, compression=PARQUET_COMPRESSION
+                )
+            else:
+                self._writer = pa.ipc.new_file(self.path, self._schema)
+        else:
+            table = pa.Table.from_pandas(
+                chunk, schema=self._schema, preserve_index=False
+            )
+
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
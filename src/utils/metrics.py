@@ -0,0 +1,335 @@
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from src.logger.logger import logger
+
+
+# Latency buckets in seconds, from 100us to 10s
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace('"', '\\"')
+            .replace("\n", "\\n")
+        )
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+# -------------------- Metric children --------------------
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def set_total(self, total: float) -> None:
+        # For totals counted elsewhere (a component's own stats) and
+        # mirrored on scrape; a smaller total is ignored, never a decrease
+        with self._lock:
+            self.value = max(self.value, float(total))
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _Timer:
+    __slots__ = ("_child", "_start")
+
+    def __init__(self, child):
+        self._child = child
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._child.observe(time.perf_counter() - self._start)
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "_lock")
+
+    def __init__(self, bounds: tuple):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last bucket is +Inf
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def time(self) -> _Timer:
+        return _Timer(self)
+
+
+# -------------------- Metrics --------------------
+class _Metric:
+    TYPE = None
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def clear(self) -> None:
+        with self._lock:
+            self._children = {}
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def render(self, extra: str = "") -> list:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}"
+        ]
+        for values, child in list(self._children.items()):
+            lines.extend(self._render_child(values, child, extra))
+        return lines
+
+
+class Counter(_Metric):
+    TYPE = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def set_total(self, total: float) -> None:
+        self.labels().set_total(total)
+
+    def _render_child(self, values, child, extra: str) -> list:
+        labels = _format_labels(self.labelnames, values, extra)
+        return [f"{self.name}{labels} {child.value}"]
+
+
+class Gauge(_Metric):
+    TYPE = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def _render_child(self, values, child, extra: str) -> list:
+        labels = _format_labels(self.labelnames, values, extra)
+        return [f"{self.name}{labels} {child.value}"]
+
+
+class Histogram(_Metric):
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self) -> _Timer:
+        return self.labels().time()
+
+    def _render_child(self, values, child, extra: str) -> list:
+        lines = []
+        cumulative = 0
+        bounds = [str(b) for b in self.buckets] + ["+Inf"]
+        prefix = f"{extra}," if extra else ""
+        for bound, count in zip(bounds, child.counts):
+            cumulative += count
+            labels = _format_labels(
+                self.labelnames, values, f'{prefix}le="{bound}"'
+            )
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+
+        labels = _format_labels(self.labelnames, values, extra)
+        lines.append(f"{self.name}_sum{labels} {child.sum}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class _NoopMetric:
+    """
+    Stands in for every metric type when metrics are disabled, so
+    instrumented code costs one attribute lookup and an empty call.
+    """
+
+    def labels(self, *values):
+        return self
+
+    def inc(self, amount: float = 1.0) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+    def set_total(self, total: float) -> None:
+        pass
+
+    def observe(self, value: float) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def time(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NOOP = _NoopMetric()
+
+
+# -------------------- Registry --------------------
+class MetricsRegistry:
+    """
+    Minimal Prometheus-style registry: counters, gauges and histograms
+    with labels, rendered in the text exposition format. When disabled,
+    every metric is a shared no-op.
+
+    Values are per process. With ``worker_label`` every sample carries a
+    ``worker="<pid>"`` label (read at render time, so it is correct after
+    fork), which keeps the series of different server workers apart
+    instead of interleaving them into one.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, enabled: bool = True, worker_label: bool = False):
+        self.enabled = enabled
+        self.worker_label = worker_label
+        self._metrics = {}
+
+    def _register(self, metric):
+        if not self.enabled:
+            return _NOOP
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()):
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple = ()):
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple = DEFAULT_BUCKETS
+    ):
+        return self._register(
+            Histogram(name, documentation, labelnames, buckets)
+        )
+
+    def render(self) -> str:
+        extra = f'worker="{os.getpid()}"' if self.worker_label else ""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render(extra))
+        return "\n".join(lines) + "\n"
+
+
+# -------------------- Pipeline timings --------------------
+class StageTimer:
+    """
+    Wall-clock timings of pipeline stages (and anything else worth
+    recording, e.g. candidate fits), saved as JSON and logged to MLflow.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.timings = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        if self.enabled:
+            self.timings[name] = seconds
+            logger.info(f"Timing: {name} took {seconds:.3f}s")
+
+    def save(self, path: str) -> None:
+        if not self.enabled:
+            return
+        with open(path, "w") as f:
+            json.dump(self.timings, f, indent=4)
+
+    def log_to_mlflow(self, mlflow_cfg: dict, run_name: str = "pipeline") -> None:
+        if not self.enabled or not self.timings:
+            return
+
+        import mlflow
+
+        mlflow.set_tracking_uri(mlflow_cfg["tracking_uri"])
+        mlflow.set_experiment(mlflow_cfg["experiment_name"])
+        with mlflow.start_run(run_name=run_name):
+            mlflow.log_metrics(
+                {
+                    f"{name.replace(':', '_')}_seconds": seconds
+                    for name, seconds in self.timings.items()
+                }
+            )